@@ -5,13 +5,15 @@ from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
 import os
 import sys
-import threading
 import uuid
 from werkzeug.utils import secure_filename
 import logging
-import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
+import pytz
+
 # Add backend directory to Python path if running from project root
 current_dir = Path(__file__).parent.resolve()
 if str(current_dir) not in sys.path:
@@ -51,7 +53,7 @@ from auth.middleware import require_auth
 from pipeline.orchestrator import SessionProcessor
 
 from config.processing import ProcessingConfig
-from config.posthog import init_posthog, set_tracking_context, flush_posthog, capture_agent_error
+from config.posthog import init_posthog, set_tracking_context, capture_agent_error
 
 # Import rate limit configuration
 from config.rate_limit import RateLimitConfig
@@ -101,12 +103,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@app.after_request
-def after_request_flush_posthog(response):
-    """Flush PostHog events after each request so LLM analytics are sent immediately."""
-    flush_posthog()
-    return response
-
 # Log rate limiting configuration
 if RateLimitConfig.is_production():
     logger.info(f"Rate limiting: Using Redis at {RateLimitConfig.REDIS_URL}")
@@ -203,6 +199,12 @@ session_processor = SessionProcessor(
 )
 app.session_processor = session_processor
 
+# Load heavy models before the first session needs them. Under gunicorn the
+# app may be imported in the --preload master, where no threads may start, so
+# gunicorn.conf.py warms up each worker instead (post_worker_init).
+if ProcessingConfig.WARM_UP_MODELS and 'gunicorn' not in sys.modules:
+    session_processor.warm_up_in_background()
+
 
 # ============================================================================
 # Flask Endpoints
@@ -301,9 +303,10 @@ def process_input():
 
     # Step 3: EXTRACT → RESOLVE
     try:
-        extracted_events, _, _ = extractor.execute(
+        extraction_result, _, _ = extractor.execute(
             raw_input, input_type=input_type, metadata=metadata
         )
+        extracted_events = extraction_result.events
 
         if not extracted_events:
             return jsonify({
@@ -312,16 +315,33 @@ def process_input():
                 'message': 'No calendar events found in input'
             })
 
-        # Resolve temporal expressions per event
+        # Resolve temporal expressions for all events concurrently (each is
+        # a Duckling round-trip), against one shared reference time
+        try:
+            reference_time = datetime.now(pytz.timezone(timezone))
+        except pytz.UnknownTimeZoneError:
+            reference_time = None  # each resolve reports the bad zone
+
+        def _resolve(extracted):
+            try:
+                return resolve_temporal(
+                    extracted, user_timezone=timezone, reference_time=reference_time,
+                ), None
+            except Exception as e:
+                return None, e
+
+        max_workers = min(len(extracted_events), ProcessingConfig.MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            resolved = list(pool.map(_resolve, extracted_events))
+
         calendar_events = []
         warnings = []
-        for i, extracted in enumerate(extracted_events):
-            try:
-                calendar_event = resolve_temporal(extracted, user_timezone=timezone)
+        for i, (extracted, (calendar_event, error)) in enumerate(zip(extracted_events, resolved)):
+            if error is None:
                 calendar_events.append(calendar_event.model_dump())
-            except Exception as e:
-                logger.warning(f"Temporal resolution failed for event {i+1}: {e}")
-                warnings.append(f"Event {i+1} ('{extracted.summary}'): {str(e)}")
+            else:
+                logger.warning(f"Temporal resolution failed for event {i+1}: {error}")
+                warnings.append(f"Event {i+1} ('{extracted.summary}'): {str(error)}")
 
         response = {
             'success': True,
@@ -334,7 +354,7 @@ def process_input():
         return jsonify(response)
 
     except Exception as e:
-        logger.error(f"Error in extraction pipeline: {e}\n{traceback.format_exc()}")
+        logger.error(f"Error in extraction pipeline: {e}", exc_info=True)
         capture_agent_error("pipeline", e)
         return jsonify({
             'success': False,
@@ -391,7 +411,7 @@ def edit_event():
         })
 
     except Exception as e:
-        logger.error(f"Event modification failed: {e}\n{traceback.format_exc()}")
+        logger.error(f"Event modification failed: {e}", exc_info=True)
         capture_agent_error("modification", e)
         return jsonify({'error': f'Event modification failed: {str(e)}'}), 500
 
@@ -430,7 +450,7 @@ def apply_modifications(session_id):
         })
 
     except Exception as e:
-        logger.error(f"Apply modifications failed: {e}\n{traceback.format_exc()}")
+        logger.error(f"Apply modifications failed: {e}", exc_info=True)
         return jsonify({'error': f'Failed to apply modifications: {str(e)}'}), 500
 
 
@@ -769,7 +789,7 @@ def apply_preferences_endpoint():
         })
 
     except Exception as e:
-        logger.error(f"Error in preference application: {e}\n{traceback.format_exc()}")
+        logger.error(f"Error in preference application: {e}", exc_info=True)
         capture_agent_error("personalization", e)
         return jsonify({'error': f'Preference application failed: {str(e)}'}), 500
 
@@ -879,20 +899,16 @@ def create_text_session():
         session = DBSession.create(
             user_id=user_id,
             input_type='text',
-            input_content=input_text
+            input_content=input_text,
+            status='processing'
         )
 
         # Init SSE stream before spawning pipeline
         from pipeline.stream import init_stream
         init_stream(session['id'])
 
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=session_processor.process_text_session,
-            args=(session['id'], input_text)
-        )
-        thread.daemon = True  # Don't block server shutdown
-        thread.start()
+        # Start processing on the shared session pool
+        session_processor.start_text_session(session['id'], input_text, session=session)
 
         return jsonify({
             'success': True,
@@ -972,7 +988,8 @@ def upload_file_endpoint():
             session = DBSession.create(
                 user_id=user_id,
                 input_type=file_type,
-                input_content=file_path
+                input_content=file_path,
+                status='processing'
             )
         except Exception:
             # Clean up orphaned file if session creation fails
@@ -983,13 +1000,8 @@ def upload_file_endpoint():
         from pipeline.stream import init_stream
         init_stream(session['id'])
 
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=session_processor.process_file_session,
-            args=(session['id'], file_path, file_type)
-        )
-        thread.daemon = True  # Don't block server shutdown
-        thread.start()
+        # Start processing on the shared session pool
+        session_processor.start_file_session(session['id'], file_path, file_type, session=session)
 
         return jsonify({
             'success': True,
@@ -1145,20 +1157,16 @@ def create_guest_text_session():
             user_id=guest_id,
             input_type=input_type,
             input_content=input_content,
-            guest_mode=True
+            guest_mode=True,
+            status='processing'
         )
 
         # Init SSE stream before spawning pipeline
         from pipeline.stream import init_stream
         init_stream(session['id'])
 
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=session_processor.process_text_session,
-            args=(session['id'], input_content)
-        )
-        thread.daemon = True
-        thread.start()
+        # Start processing on the shared session pool
+        session_processor.start_text_session(session['id'], input_content, session=session)
 
         return jsonify({
             'success': True,
@@ -1219,7 +1227,8 @@ def upload_guest_file():
                 user_id=guest_id,
                 input_type=file_type,
                 input_content=file_path,
-                guest_mode=True
+                guest_mode=True,
+                status='processing'
             )
         except Exception:
             FileStorage.delete_file(file_path)
@@ -1229,13 +1238,8 @@ def upload_guest_file():
         from pipeline.stream import init_stream
         init_stream(session['id'])
 
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=session_processor.process_file_session,
-            args=(session['id'], file_path, file_type)
-        )
-        thread.daemon = True
-        thread.start()
+        # Start processing on the shared session pool
+        session_processor.start_file_session(session['id'], file_path, file_type, session=session)
 
         return jsonify({
             'success': True,
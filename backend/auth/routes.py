@@ -4,6 +4,7 @@ Handles user account creation and sign-in from OAuth providers.
 Separate from calendar connections - this is purely for authentication.
 """
 
+import logging
 from flask import Blueprint, jsonify, request
 from typing import Dict, Any
 
@@ -11,6 +12,8 @@ from database.models import User, Session as DBSession, Event, Calendar
 from auth.middleware import require_auth
 from database.supabase_client import get_supabase
 
+logger = logging.getLogger(__name__)
+
 # Create blueprint
 auth_bp = Blueprint('auth', __name__)
 
@@ -152,8 +155,8 @@ def sync_user_profile():
             )
             # Backfill timezone from browser if not yet set
             if browser_timezone and not existing_user.get('timezone'):
-                supabase = get_supabase()
-                supabase.table("users").update({"timezone": browser_timezone}).eq("id", user_id).execute()
+                from pipeline.personalization.service import PersonalizationService
+                PersonalizationService.save_timezone(user_id, browser_timezone)
             user = User.get_by_id(user_id)
 
         # Migrate guest sessions to authenticated user account
@@ -173,7 +176,7 @@ def sync_user_profile():
                         }).eq("id", session_id).execute()
                         migrated_sessions.append(session_id)
                 except Exception as e:
-                    print(f"Failed to migrate guest session {session_id}: {e}")
+                    logger.warning(f"Failed to migrate guest session {session_id}: {e}")
                     # Continue with other sessions even if one fails
 
         response_data = {
@@ -578,7 +581,7 @@ def delete_account():
                 import stripe
                 stripe.Subscription.cancel(user['stripe_subscription_id'])
             except Exception as e:
-                print(f"Warning: Failed to cancel Stripe subscription for user {user_id}: {e}")
+                logger.warning(f"Failed to cancel Stripe subscription for user {user_id}: {e}")
 
         # 1. Revoke OAuth tokens with all connected providers
         from calendars.routes import _revoke_provider_token
@@ -610,7 +613,7 @@ def delete_account():
                 if file_name:
                     FileStorage.delete_file(f"{user_id}/{file_name}")
         except Exception as e:
-            print(f"Warning: Failed to clean up storage files for user {user_id}: {e}")
+            logger.warning(f"Failed to clean up storage files for user {user_id}: {e}")
 
         # 6. Delete the user row from the users table
         supabase.table("users").delete().eq("id", user_id).execute()
@@ -619,7 +622,7 @@ def delete_account():
         try:
             supabase.auth.admin.delete_user(user_id)
         except Exception as e:
-            print(f"Warning: Failed to delete Supabase Auth user {user_id}: {e}")
+            logger.warning(f"Failed to delete Supabase Auth user {user_id}: {e}")
 
         return jsonify({
             'success': True,
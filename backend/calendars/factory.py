@@ -8,12 +8,14 @@ Outbound sync: sync_event(), sync_events_from_session()
 Inbound sync:  sync_session_inbound()
 """
 
+import logging
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 from database.models import User, Event, Session as DBSession
 from pipeline.events import EventService
 from config.calendar import CollectionConfig
 
+logger = logging.getLogger(__name__)
 
 INBOUND_SYNC_COOLDOWN_MINUTES = 5
 
@@ -314,8 +316,8 @@ def sync_event(
     provider_syncs = event_row.get('provider_syncs') or []
     sync_entry = next((s for s in provider_syncs if s.get('provider') == provider), None)
 
-    print(f"[sync] event={event_id[:8]} provider={provider} calendar={target_calendar_id} "
-          f"version={current_version} sync_entry={sync_entry}")
+    logger.debug(f"[sync] event={event_id[:8]} provider={provider} calendar={target_calendar_id} "
+                 f"version={current_version} sync_entry={sync_entry}")
 
     if not sync_entry:
         # DRAFT → CREATE
@@ -325,12 +327,12 @@ def sync_event(
 
         provider_event_id = created_event.get('id', event_id)
         EventService.sync_to_provider(event_id, provider, provider_event_id, target_calendar_id)
-        print(f"[sync] CREATED → provider_event_id={provider_event_id}")
+        logger.info(f"[sync] CREATED → provider_event_id={provider_event_id}")
         return {'action': 'created', 'event_id': event_id, 'provider_event_id': provider_event_id}
 
     elif sync_entry.get('synced_version') == current_version:
         # UP TO DATE → SKIP
-        print(f"[sync] SKIPPED (synced_version={sync_entry.get('synced_version')} == version={current_version})")
+        logger.debug(f"[sync] SKIPPED (synced_version={sync_entry.get('synced_version')} == version={current_version})")
         return {'action': 'skipped', 'event_id': event_id, 'provider_event_id': sync_entry.get('provider_event_id')}
 
     else:
@@ -343,7 +345,7 @@ def sync_event(
             return {'action': 'failed', 'event_id': event_id, 'error': 'Provider update returned None'}
 
         EventService.sync_to_provider(event_id, provider, provider_event_id, target_calendar_id)
-        print(f"[sync] UPDATED → provider_event_id={provider_event_id}")
+        logger.info(f"[sync] UPDATED → provider_event_id={provider_event_id}")
         return {'action': 'updated', 'event_id': event_id, 'provider_event_id': provider_event_id}
 
 
@@ -408,7 +410,7 @@ def sync_events_from_session(
             else:
                 failed.append(eid)
         except Exception as e:
-            print(f"[sync] ERROR event={eid}: {e}")
+            logger.error(f"[sync] ERROR event={eid}: {e}")
             failed.append(eid)
 
     # Mark session as added to calendar
@@ -541,7 +543,7 @@ def sync_session_inbound(
                     updated_count += 1
 
         except Exception as e:
-            print(f"[inbound-sync] Error fetching event {row['id']}: {e}")
+            logger.warning(f"[inbound-sync] Error fetching event {row['id']}: {e}")
             continue
 
     # Build final event list, excluding any we just soft-deleted
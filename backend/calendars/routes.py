@@ -3,6 +3,7 @@ Google Calendar Integration API Routes
 Handles OAuth, event creation, conflict checking, and calendar operations.
 """
 
+import logging
 from flask import Blueprint, jsonify, request, redirect
 from typing import Optional
 
@@ -12,6 +13,8 @@ from calendars.google import auth as google_auth  # Still needed for legacy toke
 from auth.middleware import require_auth
 from database.models import User, Calendar
 
+logger = logging.getLogger(__name__)
+
 # Create blueprint
 calendar_bp = Blueprint('calendar', __name__)
 
@@ -613,7 +616,7 @@ def _revoke_provider_token(user_id: str, provider: str) -> None:
             # User must revoke at appleid.apple.com
             pass
     except Exception as e:
-        print(f"Warning: Failed to revoke {provider} token for user {user_id}: {e}")
+        logger.warning(f"Failed to revoke {provider} token for user {user_id}: {e}")
 
 
 def _delete_provider_events(user_id: str, provider: str) -> int:
@@ -626,7 +629,7 @@ def _delete_provider_events(user_id: str, provider: str) -> int:
             .eq("provider", provider).execute()
         return len(response.data)
     except Exception as e:
-        print(f"Warning: Failed to delete {provider} events for user {user_id}: {e}")
+        logger.warning(f"Failed to delete {provider} events for user {user_id}: {e}")
         return 0
 
 
@@ -640,7 +643,7 @@ def _delete_provider_calendars(user_id: str, provider: str) -> int:
             .eq("provider", provider).execute()
         return len(response.data)
     except Exception as e:
-        print(f"Warning: Failed to delete {provider} calendars for user {user_id}: {e}")
+        logger.warning(f"Failed to delete {provider} calendars for user {user_id}: {e}")
         return 0
 
 
@@ -743,8 +746,7 @@ def sync_calendar():
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Calendar sync failed for user {user_id}: {e}", exc_info=True)
         return jsonify({'error': f'Sync failed: {str(e)}'}), 500
 
 
@@ -811,9 +813,9 @@ def push_events():
                     user_submitted_events=user_submitted_events,
                     extracted_facts_list=extracted_facts_list
                 )
-                print(f"Stored {len(correction_ids)} corrections for user {user_id}")
+                logger.info(f"Stored {len(correction_ids)} corrections for user {user_id}")
             except Exception as e:
-                print(f"Warning: Failed to log corrections: {e}")
+                logger.warning(f"Failed to log corrections: {e}")
 
         # Push each event
         created = []
@@ -833,10 +835,10 @@ def push_events():
                     skipped.append(eid)
                 else:
                     failed.append(eid)
-                    print(f"[push] FAILED event={eid}: {result.get('error', 'unknown')}")
+                    logger.warning(f"[push] FAILED event={eid}: {result.get('error', 'unknown')}")
             except Exception as e:
                 failed.append(eid)
-                print(f"[push] ERROR event={eid}: {e}")
+                logger.error(f"[push] ERROR event={eid}: {e}")
 
         # Mark session if provided
         if session_id and (created or updated):
@@ -3,6 +3,9 @@ Database query limits and defaults.
 Controls pagination, batch sizes, and default result counts.
 """
 
+import os
+import tempfile
+
 
 class QueryLimits:
     """Default limits for database queries."""
@@ -35,3 +38,52 @@ class StreamConfig:
     # Max polls for SSE stream (MAX_POLLS * POLL_INTERVAL = max stream duration)
     MAX_POLLS: int = 100
     POLL_INTERVAL_SECONDS: float = 0.1  # 100ms
+
+
+class CacheConfig:
+    """Process-local caches for per-user lookups on the session hot path."""
+
+    # Max users held by each per-user cache
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+
+    # User timezone (users.timezone), read once per session
+    USER_TIMEZONE_TTL_SECONDS: int = 300
+
+    # Personalization patterns (style_stats + calendars). Invalidated when a
+    # pattern refresh rewrites them; users without patterns are re-checked
+    # sooner so newly discovered calendars show up quickly.
+    PATTERNS_TTL_SECONDS: int = 300
+    NO_PATTERNS_TTL_SECONDS: int = 60
+
+    # Historical events with embeddings (and the similarity index built from
+    # them), reused by back-to-back sessions of the same user
+    HISTORICAL_EVENTS_TTL_SECONDS: int = 60
+    # Each entry holds up to PERSONALIZATION_HISTORICAL_LIMIT rows with
+    # embeddings (plus a FAISS index), so keep only recently active users
+    HISTORICAL_EVENTS_MAX_ENTRIES: int = 64
+
+    # EXTRACT results keyed by a hash of the exact input (identical resubmits,
+    # forwarded emails). Dates stay relative until RESOLVE, so reuse is safe.
+    EXTRACTION_TTL_SECONDS: int = 3600
+    EXTRACTION_MAX_ENTRIES: int = 256
+
+    # Duckling parses keyed by (text, timezone, reference time). A batch
+    # shares one reference time, so repeated expressions parse once.
+    DUCKLING_PARSE_TTL_SECONDS: int = 300
+    DUCKLING_PARSE_MAX_ENTRIES: int = 1024
+
+    # Docling Markdown on local disk, keyed by a hash of the file bytes
+    # (re-uploads of the same document skip layout/OCR). Shared by every
+    # worker on the host and readable only by the app user; files expire
+    # after the TTL and the oldest go first once over the size cap.
+    DOCUMENT_CACHE_DIR: str = os.getenv(
+        'DROPCAL_DOCUMENT_CACHE_DIR',
+        os.path.join(tempfile.gettempdir(), 'dropcal-docling'),
+    )
+    DOCUMENT_CACHE_MAX_BYTES: int = int(os.getenv('DROPCAL_DOCUMENT_CACHE_MAX_MB', '256')) * 1024 * 1024
+    DOCUMENT_CACHE_TTL_SECONDS: int = 3600
+
+    # Audio transcripts keyed by storage path + provider/model (uploads get a
+    # unique path, so a retried or reprocessed session skips transcription)
+    TRANSCRIPT_TTL_SECONDS: int = 3600
+    TRANSCRIPT_MAX_ENTRIES: int = 128
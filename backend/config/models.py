@@ -4,6 +4,7 @@ All AI model definitions and stage assignments in one place.
 """
 
 import os
+import threading
 from typing import Dict, Any
 from dataclasses import dataclass, field
 
@@ -128,9 +129,18 @@ def get_extraction_threshold() -> int:
     return CONFIG.extraction.complexity_threshold
 
 
+# model name → LangChain LLM. Paths assigned the same model share one client
+# (and its HTTP connection pool) instead of each opening their own.
+_llm_instances: Dict[str, Any] = {}
+_llm_instances_lock = threading.Lock()
+
+
 def create_llm(path: str):
     """
-    Create a LangChain LLM for a config path.
+    Get the LangChain LLM for a config path.
+
+    Instances are shared per model, so config paths assigned the same model
+    reuse one client and its keep-alive connections.
 
     Examples:
         create_llm('extraction.text_simple')
@@ -139,8 +149,17 @@ def create_llm(path: str):
         create_llm('modification.modify')
     """
     model_name = get_assigned_model(path)
-    specs = get_model_specs(model_name)
-    return _create_llm(model_name, specs)
+    llm = _llm_instances.get(model_name)
+    if llm is not None:
+        return llm
+    # Session, context and /process threads can all ask for the same model
+    # at once; build each client only once
+    with _llm_instances_lock:
+        llm = _llm_instances.get(model_name)
+        if llm is None:
+            llm = _create_llm(model_name, get_model_specs(model_name))
+            _llm_instances[model_name] = llm
+    return llm
 
 
 def _create_llm(model_name: str, specs: Dict[str, Any]):
@@ -12,6 +12,7 @@ client (and its consumer thread) are created inside the worker process.
 
 import os
 import atexit
+import functools
 import logging
 import threading
 import time as _time
@@ -29,6 +30,10 @@ _local = threading.local()
 # (None = "don't update", CLEAR = "reset to None").
 CLEAR = object()
 
+# The SDK's consumer thread sends queued events in batches at least this
+# often, so requests never wait on PostHog egress to get events out quickly.
+_FLUSH_INTERVAL_SECONDS = 0.2
+
 # Detected once at import time — included on every PostHog event for filtering.
 _ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 
@@ -58,7 +63,7 @@ def _ensure_client():
             from posthog import Posthog
 
             host = os.getenv('POSTHOG_HOST', 'https://us.i.posthog.com')
-            _posthog_client = Posthog(api_key, host=host)
+            _posthog_client = Posthog(api_key, host=host, flush_interval=_FLUSH_INTERVAL_SECONDS)
             atexit.register(_posthog_client.shutdown)
             logger.info(f"PostHog: Initialized in pid {os.getpid()} (host={host})")
         except ImportError:
@@ -151,6 +156,76 @@ def set_tracking_context(
     _set('parent_id', parent_id)
 
 
+@contextmanager
+def tracking_override(**fields):
+    """
+    Temporarily override tracking-context fields for the current thread.
+
+    Only the overridden fields are saved and restored on exit, so a stage
+    or loop body doesn't need a follow-up set_tracking_context(...=CLEAR).
+    CLEAR (or None) blanks a field for the duration of the block.
+
+    Usage:
+        with tracking_override(calendar_name=cal_name):
+            summary = analyze(...)
+    """
+    previous = {name: getattr(_local, name, None) for name in fields}
+    for name, value in fields.items():
+        setattr(_local, name, None if value is CLEAR else value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(_local, name, value)
+
+
+# Every field set_tracking_context manages (for snapshots handed to other threads)
+_TRACKING_FIELDS = (
+    'distinct_id', 'trace_id', 'session_id', 'pipeline',
+    'input_type', 'is_guest', 'num_events', 'has_personalization',
+    'event_index', 'event_description', 'calendar_name', 'parent_id',
+)
+
+
+def get_tracking_snapshot():
+    """Copy the current thread's tracking context into a plain dict.
+
+    Pass it to work submitted to another thread and apply it there with
+    apply_tracking_snapshot(), so the worker attributes its events to the
+    same trace without re-deriving user/session ids.
+    """
+    return {name: getattr(_local, name, None) for name in _TRACKING_FIELDS}
+
+
+def apply_tracking_snapshot(snapshot):
+    """Replace the current thread's tracking context with a snapshot.
+
+    Fields missing from the snapshot are reset, so nothing leaks in from
+    earlier work on a reused pool thread.
+    """
+    for name in _TRACKING_FIELDS:
+        setattr(_local, name, snapshot.get(name))
+
+
+def isolated_tracking_context(func):
+    """
+    Decorator: run `func` with an empty tracking context and clear it again
+    afterwards.
+
+    Entry points that run on pooled threads use this so nothing set by the
+    previous job on the thread (num_events, calendar_name, ...) leaks into
+    the next one, without listing every field as CLEAR.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        apply_tracking_snapshot({})
+        try:
+            return func(*args, **kwargs)
+        finally:
+            apply_tracking_snapshot({})
+    return wrapper
+
+
 def get_tracking_property(name, default=None):
     """Read a single value from the thread-local tracking context."""
     return getattr(_local, name, default)
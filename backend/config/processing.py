@@ -16,8 +16,34 @@ class ProcessingConfig:
     # Maximum events to process per request (after EXTRACT stage)
     MAX_EVENTS_PER_REQUEST: int = EventLimits.MAX_EVENTS_PER_REQUEST
 
-    # Max concurrent threads for pipeline per request
-    MAX_WORKERS: int = int(os.getenv('DROPCAL_MAX_WORKERS', '5'))
+    # Max concurrent threads for pipeline per request. Per-event work is
+    # network-bound (Duckling, Supabase, LLM calls), so threads mostly sit
+    # waiting on sockets — default well above the core count.
+    MAX_WORKERS: int = int(os.getenv(
+        'DROPCAL_MAX_WORKERS', str(min(32, (os.cpu_count() or 1) * 4))
+    ))
+
+    # Threads shared by all sessions for fire-and-forget side work
+    # (icon selection, background embeddings)
+    BACKGROUND_WORKERS: int = int(os.getenv('DROPCAL_BACKGROUND_WORKERS', '4'))
+
+    # Max sessions running the pipeline at once per process. Further sessions
+    # queue (their SSE stream stays open) instead of each spawning a thread.
+    SESSION_WORKERS: int = int(os.getenv('DROPCAL_SESSION_WORKERS', '32'))
+
+    # Threads for the per-session calendar list lookup, which context loading
+    # waits on — kept off the background pool so it never queues behind
+    # warm-up, icon selection or embeddings
+    CALENDAR_LOOKUP_WORKERS: int = int(os.getenv('DROPCAL_CALENDAR_LOOKUP_WORKERS', '8'))
+
+    # Max Docling conversions running at once per process. Conversion is
+    # CPU/memory heavy (layout + OCR models); capping it keeps one large PDF
+    # upload from starving every other session on the worker.
+    MAX_DOCUMENT_CONVERSIONS: int = int(os.getenv('DROPCAL_MAX_DOCUMENT_CONVERSIONS', '2'))
+
+    # Load the embedding model and Docling pipeline when a worker starts
+    # instead of on the first session that needs them
+    WARM_UP_MODELS: bool = os.getenv('DROPCAL_WARM_UP', 'true').lower() != 'false'
 
     # Timeout per individual event processing, in seconds
     PER_EVENT_TIMEOUT: int = 60
@@ -25,6 +51,14 @@ class ProcessingConfig:
     # Total timeout for entire batch of events, in seconds
     BATCH_TIMEOUT: int = 300
 
+    # Lifetime of the signed storage URL handed to the transcription provider
+    # (it fetches the recording right away)
+    AUDIO_URL_EXPIRES_SECONDS: int = 300
+
+    # Max seconds RESOLVE waits for the user's timezone from context loading
+    # before falling back to the default
+    TIMEZONE_WAIT_SECONDS: int = 10
+
     @classmethod
     def get_text_limit_error_message(cls, actual_length: int) -> str:
         return (
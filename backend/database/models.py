@@ -3,6 +3,7 @@ Database models for User and Session operations.
 Provides CRUD operations for Supabase tables.
 """
 
+import logging
 import secrets
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -10,6 +11,8 @@ from .supabase_client import get_supabase
 from auth.encryption import encrypt_token, decrypt_token
 from config.database import QueryLimits
 
+logger = logging.getLogger(__name__)
+
 
 class User:
     """User model for database operations."""
@@ -756,7 +759,13 @@ class Session:
     """Session model for database operations."""
 
     @staticmethod
-    def create(user_id: str, input_type: str, input_content: str, guest_mode: bool = False) -> Dict[str, Any]:
+    def create(
+        user_id: str,
+        input_type: str,
+        input_content: str,
+        guest_mode: bool = False,
+        status: str = "pending"
+    ) -> Dict[str, Any]:
         """
         Create a new session.
 
@@ -765,6 +774,8 @@ class Session:
             input_type: Type of input ('text', 'image', 'audio', 'email')
             input_content: Original text or file path
             guest_mode: Whether this is a guest session (default: False)
+            status: Initial status ('processing' when the pipeline is started
+                    right away, so it doesn't need to write it again)
 
         Returns:
             Dict containing the created session data (includes access_token for guest sessions)
@@ -775,7 +786,7 @@ class Session:
             "user_id": user_id,
             "input_type": input_type,
             "input_content": input_content,
-            "status": "pending",
+            "status": status,
             "guest_mode": guest_mode
         }
 
@@ -904,7 +915,8 @@ class Session:
     @staticmethod
     def update_extracted_events(
         session_id: str,
-        extracted_events: List[Dict]
+        extracted_events: List[Dict],
+        status: str = "processing"
     ) -> Dict[str, Any]:
         """
         Update session with extracted events (IDENTIFY output).
@@ -912,6 +924,8 @@ class Session:
         Args:
             session_id: Session's UUID
             extracted_events: List of raw extracted events
+            status: Status to set in the same write ('processed' when the
+                    pipeline has already saved its events)
 
         Returns:
             Dict containing updated session data
@@ -920,7 +934,7 @@ class Session:
 
         response = supabase.table("sessions").update({
             "extracted_events": extracted_events,
-            "status": "processing"
+            "status": status
         }).eq("id", session_id).execute()
         return response.data[0]
 
@@ -1091,7 +1105,7 @@ class Session:
                 from pipeline.input.storage import FileStorage
                 FileStorage.delete_file(input_content)
             except Exception as e:
-                print(f"Warning: Failed to delete file {input_content} for session {session_id}: {e}")
+                logger.warning("Failed to delete file %s for session %s: %s", input_content, session_id, e)
 
         # Hard-delete associated events
         event_ids = session.get('event_ids') or []
@@ -1099,7 +1113,7 @@ class Session:
             try:
                 supabase.table("events").delete().in_("id", event_ids).execute()
             except Exception as e:
-                print(f"Warning: Failed to delete events for session {session_id}: {e}")
+                logger.warning("Failed to delete events for session %s: %s", session_id, e)
 
         # Delete the session itself
         response = supabase.table("sessions").delete().eq("id", session_id).execute()
@@ -1150,11 +1164,12 @@ class Session:
 
         supabase = get_supabase()
 
-        session = Session.get_by_id(session_id)
-        if not session:
+        # Only event_ids is needed — skip the input/processed blobs
+        response = supabase.table("sessions").select("event_ids").eq("id", session_id).execute()
+        if not response.data:
             raise ValueError(f"Session {session_id} not found")
 
-        existing = session.get('event_ids', []) or []
+        existing = response.data[0].get('event_ids', []) or []
         existing_set = set(existing)
         merged = existing + [eid for eid in event_ids_to_add if eid not in existing_set]
 
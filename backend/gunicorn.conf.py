@@ -0,0 +1,28 @@
+"""
+Gunicorn settings picked up automatically from the working directory
+(`cd backend && gunicorn wsgi:app ...`). Command-line flags still apply.
+"""
+
+
+def post_worker_init(worker):
+    """Warm up models in each worker once it has loaded the app.
+
+    Runs in the worker, with or without --preload, and never in the
+    master — threads must not be started before forking.
+    """
+    from config.processing import ProcessingConfig
+
+    processor = getattr(worker.wsgi, 'session_processor', None)
+    if ProcessingConfig.WARM_UP_MODELS and processor is not None:
+        processor.warm_up_in_background()
+
+
+def worker_exit(server, worker):
+    """Drop sessions still queued for a pipeline thread before the worker exits.
+
+    In-flight sessions finish; queued ones are marked errored instead of all
+    running first (restarts, max-requests recycling).
+    """
+    from pipeline.orchestrator import cancel_queued_sessions
+
+    cancel_queued_sessions()
@@ -0,0 +1,69 @@
+"""
+Small in-process TTL cache for hot-path lookups.
+
+Process-local (each gunicorn worker keeps its own copy), thread-safe, and
+bounded: every insert purges expired entries, and once full the least
+recently used entry is evicted.
+
+    from pipeline.cache import TTLCache
+
+    _cache = TTLCache(maxsize=256, ttl=3600)
+    value = _cache.get(key)
+    if value is None:
+        value = compute()
+        _cache.set(key, value)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key → (value, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, purging expired entries and evicting the LRU one if full."""
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            # Drop expired entries on every write so values that are never
+            # read again don't sit in memory until the cache fills up
+            expired = [k for k, (_, exp) in self._data.items() if exp <= now]
+            for k in expired:
+                del self._data[k]
+            while len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (value, now + (self.ttl if ttl is None else ttl))
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a key (no-op if absent)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
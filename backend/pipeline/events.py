@@ -99,6 +99,9 @@ class EventService:
         Returns:
             List of CalendarEvent dicts for the full updated session
         """
+        # Creates are collected and inserted together after the loop
+        create_params: List[Dict[str, Any]] = []
+
         for act in actions:
             action_type = act.get('action')
 
@@ -150,11 +153,22 @@ class EventService:
                     logger.warning(f"Skipping create action: missing summary")
                     continue
 
-                EventService.create_from_calendar_event(user_id, session_id, cal_event)
+                create_params.append(EventService.calendar_event_to_db_params(cal_event))
 
             else:
                 logger.warning(f"Unknown modification action type: {action_type}")
 
+        if create_params:
+            # One INSERT + one session link instead of an insert and a
+            # read-modify-write of event_ids per created event
+            created_events = EventService.create_dropcal_events_batch(
+                user_id=user_id,
+                session_id=session_id,
+                events_data=create_params,
+            )
+            # Edited sessions are searched right away, so embed before returning
+            EventService.compute_embeddings_background(created_events, create_params)
+
         # If the session has no events left, delete it
         session = Session.get_by_id(session_id)
         if session and len(session.get('event_ids') or []) == 0:
@@ -1036,7 +1050,7 @@ class EventService:
 
                 count += 1
             except Exception as e:
-                print(f"Error computing embedding for event {event['id']}: {e}")
+                logger.warning(f"Error computing embedding for event {event['id']}: {e}")
                 continue
 
         return count
@@ -18,6 +18,7 @@ Usage:
     # Returns ExtractedEventBatch with session_title and events
 """
 
+import hashlib
 import logging
 import time as _time
 from typing import List, Optional, Dict
@@ -25,12 +26,40 @@ from typing import List, Optional, Dict
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from pipeline.base_agent import BaseAgent
-from pipeline.prompt_loader import load_prompt
+from pipeline.prompt_loader import load_static_prompt
 from pipeline.models import ExtractedEvent, ExtractedEventBatch
+from pipeline.cache import TTLCache
+from config.database import CacheConfig
 from config.posthog import capture_llm_generation
 
 logger = logging.getLogger(__name__)
 
+# sha256(model config, system prompt, user content) → ExtractedEventBatch
+_result_cache = TTLCache(
+    maxsize=CacheConfig.EXTRACTION_MAX_ENTRIES,
+    ttl=CacheConfig.EXTRACTION_TTL_SECONDS,
+)
+
+
+def _result_cache_key(config_path: str, system_prompt: str, *user_parts: str) -> str:
+    """Exact-match key for an extraction call.
+
+    The system prompt is part of the key, so editing the prompt (or the
+    model assignment) naturally invalidates earlier results.
+    """
+    h = hashlib.sha256()
+    for part in (config_path, system_prompt, *user_parts):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _cached_result(cache_key: str):
+    """Return a private copy of a cached batch (callers mutate downstream), or None."""
+    cached = _result_cache.get(cache_key)
+    return cached.model_copy(deep=True) if cached is not None else None
+
+
 _INPUT_TYPE_LABELS = {
     'text': 'Plain text',
     'image': 'Image (screenshot, photo)',
@@ -94,6 +123,17 @@ class UnifiedExtractor(BaseAgent):
         self.llm_vision = llm_vision or llm_complex
         self.complexity_threshold = complexity_threshold
 
+        # Structured-output runnables are built once here rather than per call
+        # (schema → tool/JSON-schema conversion happens on construction)
+        self._structured = {
+            config_path: llm.with_structured_output(ExtractedEventBatch, include_raw=True)
+            for config_path, llm in (
+                ('extraction.text_simple', self.llm_simple),
+                ('extraction.text_complex', self.llm_complex),
+                ('extraction.vision', self.llm_vision),
+            )
+        }
+
     def execute(
         self,
         text: str,
@@ -128,23 +168,28 @@ class UnifiedExtractor(BaseAgent):
 
     def _execute_text(self, text: str, input_type: str) -> tuple:
         """Text path: single structured output call."""
-        system_prompt = load_prompt("pipeline/extraction/prompts/unified_extract.txt")
+        system_prompt = load_static_prompt("pipeline/extraction/prompts/unified_extract.txt")
 
         source_label = _INPUT_TYPE_LABELS.get(input_type, input_type or 'text')
         user_message = f"[SOURCE TYPE: {source_label}]\n\n{text}"
 
-        llm, config_path = self._pick_text_model(text)
-        logger.info(f"Extraction using {config_path} (input: {len(text)} chars, threshold: {self.complexity_threshold})")
-
-        structured_llm = llm.with_structured_output(
-            ExtractedEventBatch, include_raw=True
-        )
+        _, config_path = self._pick_text_model(text)
 
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_message),
         ]
 
+        cache_key = _result_cache_key(config_path, system_prompt, user_message)
+        cached = _cached_result(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit ({len(cached.events)} events, input: {len(text)} chars)")
+            return cached, messages, None
+
+        logger.info(f"Extraction using {config_path} (input: {len(text)} chars, threshold: {self.complexity_threshold})")
+
+        structured_llm = self._structured[config_path]
+
         t0 = _time.time()
         raw_result = structured_llm.invoke(messages)
         duration_ms = (_time.time() - t0) * 1000
@@ -165,12 +210,15 @@ class UnifiedExtractor(BaseAgent):
         if not result or not result.events:
             return ExtractedEventBatch(session_title="Untitled", input_summary="", events=[]), messages, raw_ai_message
 
+        # Only cache non-empty results so a miss on a flaky call can be retried
+        _result_cache.set(cache_key, result.model_copy(deep=True))
+
         logger.info(f"Extracted {len(result.events)} events from {input_type} input")
         return result, messages, raw_ai_message
 
     def _execute_vision(self, text: str, metadata: Dict) -> tuple:
         """Vision path: multimodal message with image."""
-        system_prompt = load_prompt("pipeline/extraction/prompts/unified_extract.txt")
+        system_prompt = load_static_prompt("pipeline/extraction/prompts/unified_extract.txt")
 
         image_data = metadata.get('image_data', '')
         media_type = metadata.get('media_type', 'image/jpeg')
@@ -190,15 +238,23 @@ class UnifiedExtractor(BaseAgent):
             },
         ]
 
-        structured_llm = self.llm_vision.with_structured_output(
-            ExtractedEventBatch, include_raw=True
-        )
-
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=content),
         ]
 
+        # Same screenshot uploaded again → same result
+        cache_key = _result_cache_key(
+            'extraction.vision', system_prompt, media_type,
+            hashlib.sha256(image_data.encode('ascii')).hexdigest(), user_text,
+        )
+        cached = _cached_result(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit ({len(cached.events)} events, image input)")
+            return cached, messages, None
+
+        structured_llm = self._structured['extraction.vision']
+
         t0 = _time.time()
         raw_result = structured_llm.invoke(messages)
         duration_ms = (_time.time() - t0) * 1000
@@ -219,5 +275,7 @@ class UnifiedExtractor(BaseAgent):
         if not result or not result.events:
             return ExtractedEventBatch(session_title="Untitled", input_summary="", events=[]), messages, raw_ai_message
 
+        _result_cache.set(cache_key, result.model_copy(deep=True))
+
         logger.info(f"Extracted {len(result.events)} events from image input")
         return result, messages, raw_ai_message
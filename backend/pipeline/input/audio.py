@@ -4,13 +4,35 @@ Multi-provider audio transcription (Deepgram, OpenAI Whisper, Grok)
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, Set, Optional
 from config.models import get_audio_provider, get_audio_api_key, get_audio_model_name
 
 from .factory import BaseInputProcessor, ProcessingResult, InputType
 
 
+class _FileChunks:
+    """Re-iterable chunked reader for upload bodies.
+
+    Lets the HTTP client stream a recording from disk instead of holding a
+    full in-memory copy. Each iteration reopens the file, so an SDK retry
+    re-sends the whole body rather than an exhausted stream.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = 1 << 20):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        with open(self.file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
 class AudioProcessor(BaseInputProcessor):
     """
     Processes audio files (voice notes, recordings, etc.) into text.
@@ -23,6 +45,12 @@ class AudioProcessor(BaseInputProcessor):
         '.m4a', '.wav', '.webm', '.ogg', '.flac'
     }
 
+    # (provider, api_key) → client. Provider clients hold a pooled HTTP
+    # client, so every processor instance shares one and keeps its
+    # connections (and TLS sessions) warm.
+    _shared_clients: Dict[tuple, object] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the audio processor with the configured provider.
@@ -34,27 +62,47 @@ class AudioProcessor(BaseInputProcessor):
         self.api_key = api_key or get_audio_api_key()
         self.model = get_audio_model_name()
 
-        # Initialize provider-specific client
-        if self.provider == 'deepgram':
+        if self.provider == 'vapi':
+            # Vapi client initialization
+            # Note: Vapi typically uses REST API calls
+            self.public_key = os.getenv('VAPI_PUBLIC_KEY')
+            self.client = None  # Will use requests library for API calls
+        else:
+            self.client = self._get_shared_client(self.provider, self.api_key)
+
+    @classmethod
+    def _get_shared_client(cls, provider: str, api_key: str):
+        """Get or create the provider client shared by all instances."""
+        key = (provider, api_key)
+        client = cls._shared_clients.get(key)
+        if client is not None:
+            return client
+        with cls._clients_lock:
+            client = cls._shared_clients.get(key)
+            if client is None:
+                client = cls._create_client(provider, api_key)
+                cls._shared_clients[key] = client
+        return client
+
+    @staticmethod
+    def _create_client(provider: str, api_key: str):
+        """Initialize provider-specific client"""
+        if provider == 'deepgram':
             from deepgram import DeepgramClient
             # Deepgram requires env variable
-            os.environ['DEEPGRAM_API_KEY'] = self.api_key
-            self.client = DeepgramClient()
-        elif self.provider == 'openai':
+            os.environ['DEEPGRAM_API_KEY'] = api_key
+            return DeepgramClient()
+        elif provider == 'openai':
             from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key)
-        elif self.provider == 'grok':
+            return OpenAI(api_key=api_key)
+        elif provider == 'grok':
             from openai import OpenAI
             # Grok uses OpenAI-compatible API
-            self.client = OpenAI(
-                api_key=self.api_key,
+            return OpenAI(
+                api_key=api_key,
                 base_url="https://api.x.ai/v1"
             )
-        elif self.provider == 'vapi':
-            # Vapi client initialization
-            # Note: Vapi typically uses REST API calls
-            self.public_key = os.getenv('VAPI_PUBLIC_KEY')
-            self.client = None  # Will use requests library for API calls
+        return None
 
     def supports_file(self, file_path: str) -> bool:
         """Check if file is a supported audio format"""
@@ -109,13 +157,10 @@ class AudioProcessor(BaseInputProcessor):
             language = kwargs.get('language', 'en')
             smart_format = kwargs.get('smart_format', True)
 
-            # Read audio file
-            with open(file_path, 'rb') as audio_file:
-                buffer_data = audio_file.read()
-
-            # Transcribe (SDK v5 uses keyword-only args)
+            # Transcribe (SDK v5 uses keyword-only args); the body is
+            # streamed from disk in chunks
             response = self.client.listen.v1.media.transcribe_file(
-                request=buffer_data,
+                request=_FileChunks(file_path),
                 model=self.model,
                 language=language,
                 smart_format=smart_format,
@@ -158,6 +203,82 @@ class AudioProcessor(BaseInputProcessor):
                 error=f"Deepgram transcription failed: {str(e)}"
             )
 
+    @property
+    def supports_url(self) -> bool:
+        """Whether the provider can fetch the audio itself (see process_url)."""
+        return self.provider == 'deepgram'
+
+    def process_url(self, url: str, file_name: str = '', **kwargs) -> ProcessingResult:
+        """
+        Transcribe audio the provider downloads from `url` (e.g. a signed
+        storage URL), so the file never passes through this process.
+
+        Args:
+            url: Publicly fetchable URL of the audio file
+            file_name: Original file name (format check + metadata)
+            **kwargs: Optional parameters (provider-specific)
+
+        Returns:
+            ProcessingResult with transcribed text and metadata
+        """
+        if file_name and not self.supports_file(file_name):
+            return ProcessingResult(
+                text="",
+                input_type=InputType.AUDIO,
+                success=False,
+                error=f"Unsupported audio format: {Path(file_name).suffix}"
+            )
+
+        if not self.supports_url:
+            return ProcessingResult(
+                text="",
+                input_type=InputType.AUDIO,
+                success=False,
+                error=f"URL transcription not supported for provider: {self.provider}"
+            )
+
+        try:
+            language = kwargs.get('language', 'en')
+            smart_format = kwargs.get('smart_format', True)
+
+            response = self.client.listen.v1.media.transcribe_url(
+                url=url,
+                model=self.model,
+                language=language,
+                smart_format=smart_format,
+                punctuate=True,
+            )
+
+            if response.results and response.results.channels:
+                channel = response.results.channels[0]
+                if channel.alternatives:
+                    return ProcessingResult(
+                        text=channel.alternatives[0].transcript,
+                        input_type=InputType.AUDIO,
+                        metadata={
+                            'provider': 'deepgram',
+                            'model': self.model,
+                            'language': language,
+                            'file_name': Path(file_name).name,
+                        },
+                        success=True
+                    )
+
+            return ProcessingResult(
+                text="",
+                input_type=InputType.AUDIO,
+                success=False,
+                error="No transcription results returned from Deepgram"
+            )
+
+        except Exception as e:
+            return ProcessingResult(
+                text="",
+                input_type=InputType.AUDIO,
+                success=False,
+                error=f"Deepgram transcription failed: {str(e)}"
+            )
+
     def _process_openai_compatible(self, file_path: str, **kwargs) -> ProcessingResult:
         """Process audio using OpenAI Whisper or Grok (OpenAI-compatible)"""
         try:
@@ -256,12 +377,9 @@ class AudioProcessor(BaseInputProcessor):
             language = kwargs.get('language', 'en')
             smart_format = kwargs.get('smart_format', True)
 
-            with open(file_path, 'rb') as audio_file:
-                buffer_data = audio_file.read()
-
             # SDK v5 uses keyword-only args
             response = self.client.listen.v1.media.transcribe_file(
-                request=buffer_data,
+                request=_FileChunks(file_path),
                 model=self.model,
                 language=language,
                 smart_format=smart_format,
@@ -4,14 +4,136 @@ Handles docx, pptx, xlsx, html, and csv formats.
 """
 
 import os
+import hashlib
 import logging
+import threading
+import time
+from io import BytesIO
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 
 from .factory import BaseInputProcessor, ProcessingResult, InputType
+from config.database import CacheConfig
+from config.processing import ProcessingConfig
 
 logger = logging.getLogger(__name__)
 
+_converter_instance = None
+_converter_lock = threading.Lock()
+_conversion_slots = threading.BoundedSemaphore(ProcessingConfig.MAX_DOCUMENT_CONVERSIONS)
+
+
+def get_document_converter():
+    """Get or create the shared Docling DocumentConverter.
+
+    Construction sets up format options and pipeline plumbing, and the
+    converter caches its initialized pipelines (layout/OCR models) between
+    calls, so reusing one instance avoids rebuilding them per document.
+    """
+    global _converter_instance
+    if _converter_instance is None:
+        with _converter_lock:
+            if _converter_instance is None:
+                from docling.document_converter import DocumentConverter
+                _converter_instance = DocumentConverter()
+    return _converter_instance
+
+
+def convert_to_markdown(source) -> str:
+    """Convert a document (path or DocumentStream) to Markdown with Docling.
+
+    At most ProcessingConfig.MAX_DOCUMENT_CONVERSIONS run at once; further
+    callers wait for a slot.
+    """
+    with _conversion_slots:
+        result = get_document_converter().convert(source)
+    return result.document.export_to_markdown()
+
+
+def _cache_path(digest: str) -> Path:
+    return Path(CacheConfig.DOCUMENT_CACHE_DIR) / f"{digest}.md"
+
+
+def _read_cached_markdown(digest: str) -> Optional[str]:
+    """Return cached Markdown for a file hash, or None if missing or expired."""
+    path = _cache_path(digest)
+    try:
+        if time.time() - path.stat().st_mtime > CacheConfig.DOCUMENT_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def _write_cached_markdown(digest: str, text: str) -> None:
+    """Store Markdown atomically (owner-only permissions), then trim the cache."""
+    path = _cache_path(digest)
+    try:
+        # Document text is user data: keep the directory and files private
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(path.parent, 0o700)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+        _trim_cache(path.parent)
+    except OSError as e:
+        logger.warning(f"Document cache write failed: {e}")
+
+
+def _trim_cache(cache_dir: Path) -> None:
+    """Delete expired entries (and stale temp files), then the oldest until under the cap."""
+    now = time.time()
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        if not entry.name.endswith(('.md', '.tmp')):
+            continue
+        try:
+            stat = entry.stat()
+            # .tmp files older than the TTL were left behind by crashed writes
+            if now - stat.st_mtime > CacheConfig.DOCUMENT_CACHE_TTL_SECONDS:
+                os.remove(entry.path)
+                continue
+        except OSError:
+            continue
+        if entry.name.endswith('.md'):
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= CacheConfig.DOCUMENT_CACHE_MAX_BYTES:
+        return
+    for _, size, entry_path in sorted(entries):
+        try:
+            os.remove(entry_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= CacheConfig.DOCUMENT_CACHE_MAX_BYTES:
+            break
+
+
+def convert_bytes_to_markdown(file_bytes: bytes, name: str) -> str:
+    """Convert an in-memory document to Markdown, reusing earlier conversions.
+
+    Docling picks the format from `name`, so keep the original extension.
+    The result is cached on disk by a hash of the bytes and extension.
+    """
+    h = hashlib.sha256(file_bytes)
+    h.update(Path(name).suffix.lower().encode('utf-8'))
+    digest = h.hexdigest()
+
+    cached = _read_cached_markdown(digest)
+    if cached is not None:
+        logger.info(f"Document cache hit: {name} → {len(cached)} chars")
+        return cached
+
+    from docling.datamodel.base_models import DocumentStream
+    text = convert_to_markdown(DocumentStream(name=name, stream=BytesIO(file_bytes)))
+    if text and text.strip():
+        _write_cached_markdown(digest, text)
+    return text
+
 
 class DocumentProcessor(BaseInputProcessor):
     """
@@ -70,11 +192,7 @@ class DocumentProcessor(BaseInputProcessor):
             )
 
         try:
-            from docling.document_converter import DocumentConverter
-
-            converter = DocumentConverter()
-            result = converter.convert(file_path)
-            text = result.document.export_to_markdown()
+            text = convert_to_markdown(file_path)
 
             if not text or not text.strip():
                 return ProcessingResult(
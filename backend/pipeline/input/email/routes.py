@@ -1,7 +1,6 @@
 import os
 import hmac
 import logging
-import threading
 
 from flask import Blueprint, jsonify, request, current_app
 
@@ -97,15 +96,11 @@ def receive_inbound_email():
     session = DBSession.create(
         user_id=user_id,
         input_type='email',
-        input_content=email_text
+        input_content=email_text,
+        status='processing'
     )
 
-    thread = threading.Thread(
-        target=session_processor.process_text_session,
-        args=(session['id'], email_text)
-    )
-    thread.daemon = True
-    thread.start()
+    session_processor.start_text_session(session['id'], email_text, session=session)
 
     logger.info(f"Inbound email session created: {session['id']} for user {user_id}")
 
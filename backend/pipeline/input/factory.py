@@ -20,6 +20,8 @@ class InputType(Enum):
 class ProcessingResult:
     """Standardized result from input processing"""
 
+    __slots__ = ('text', 'input_type', 'metadata', 'success', 'error')
+
     def __init__(
         self,
         text: str,
@@ -5,12 +5,15 @@ Hybrid approach: Extract text first, fallback to vision if needed
 
 import os
 import base64
+import logging
 from pathlib import Path
 from typing import List, Dict, Any
 
 from .factory import BaseInputProcessor, ProcessingResult, InputType
 from config.limits import FileLimits, TextLimits, PDFLimits
 
+logger = logging.getLogger(__name__)
+
 
 class PDFProcessor(BaseInputProcessor):
     """
@@ -56,16 +59,14 @@ class PDFProcessor(BaseInputProcessor):
             return ""
 
         try:
-            from docling.document_converter import DocumentConverter
+            from .document import convert_to_markdown
 
-            converter = DocumentConverter()
-            result = converter.convert(file_path)
-            text = result.document.export_to_markdown()
+            text = convert_to_markdown(file_path)
 
             return text or ""
 
         except Exception as e:
-            print(f"Text extraction failed: {e}")
+            logger.warning(f"Text extraction failed: {e}")
             return ""
 
     def _has_sufficient_text(self, text: str) -> bool:
@@ -130,7 +131,7 @@ class PDFProcessor(BaseInputProcessor):
             return image_data_list
 
         except Exception as e:
-            print(f"PDF rendering failed: {e}")
+            logger.warning(f"PDF rendering failed: {e}")
             return []
 
     def process(self, file_path: str, **kwargs) -> ProcessingResult:
@@ -112,6 +112,33 @@ class FileStorage:
 
         return response
 
+    @staticmethod
+    def download_to_file(file_path: str, dest: BinaryIO, chunk_size: int = 1 << 20) -> int:
+        """
+        Stream a file from storage into an open binary file, chunk by chunk.
+
+        Unlike download_file, the content is never held in memory as a whole,
+        so large uploads (e.g. long audio) cost O(chunk_size) RAM.
+
+        Args:
+            file_path: Path to file in storage
+            dest: Writable binary file object
+            chunk_size: Bytes per read (default 1 MB)
+
+        Returns:
+            int: Number of bytes written
+        """
+        import requests
+
+        url = FileStorage.get_file_url(file_path, expires_in=300)
+        written = 0
+        with requests.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                dest.write(chunk)
+                written += len(chunk)
+        return written
+
     @staticmethod
     def delete_file(file_path: str) -> bool:
         """
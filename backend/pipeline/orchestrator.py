@@ -5,13 +5,17 @@ Pipeline: EXTRACT (1 LLM call) → RESOLVE (0 LLM, Duckling) → PERSONALIZE (0-
 """
 
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from io import BytesIO
+from pathlib import Path
 import os
 import logging
+import tempfile
 import threading
-import traceback
-from database.models import Session as DBSession, Event
+from database.models import Session as DBSession, Event, Calendar
 from pipeline.input.factory import InputProcessorFactory, InputType
+from pipeline.input.storage import FileStorage
+from pipeline.input.document import convert_bytes_to_markdown
 from pipeline.extraction.extract import UnifiedExtractor
 from pipeline.resolution.temporal_resolver import resolve_temporal
 from pipeline.personalization.agent import PersonalizationAgent
@@ -19,15 +23,117 @@ from pipeline.extraction.icon_selector import get_icon_selector
 from pipeline.events import EventService
 from pipeline.personalization.service import PersonalizationService
 from pipeline.stream import get_stream
+from pipeline.cache import TTLCache
+from config.database import CacheConfig
+from config.processing import ProcessingConfig
 from config.posthog import (
-    set_tracking_context, flush_posthog, capture_agent_error,
-    capture_pipeline_trace, stage_span,
-    get_tracking_property, CLEAR,
+    set_tracking_context, capture_agent_error,
+    capture_pipeline_trace, stage_span, tracking_override,
+    get_tracking_property, get_tracking_snapshot, apply_tracking_snapshot,
+    isolated_tracking_context, CLEAR,
 )
 import time as _time
+from datetime import datetime
+
+import pytz
+
+try:
+    # SIMD base64 encoder; image uploads are encoded on the critical path
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+    import base64
+
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
 
 logger = logging.getLogger(__name__)
 
+# Shared by all sessions for side work that never blocks the pipeline. Threads
+# start lazily on first submit (after any gunicorn fork) and are reused, rather
+# than spawning a new OS thread per session.
+_background_pool = ThreadPoolExecutor(
+    max_workers=ProcessingConfig.BACKGROUND_WORKERS,
+    thread_name_prefix='session-bg',
+)
+
+# Runs the pipeline itself for sessions started from request handlers. Pool
+# threads aren't daemons: at interpreter exit every queued session would run
+# before the process could go, so cancel_queued_sessions() (gunicorn's
+# worker_exit hook) drops the queue first and only in-flight sessions finish.
+_session_pool = ThreadPoolExecutor(
+    max_workers=ProcessingConfig.SESSION_WORKERS,
+    thread_name_prefix='session',
+)
+
+# Future → session_id for sessions submitted to _session_pool and not done yet
+_queued_sessions = {}
+_queued_sessions_lock = threading.Lock()
+
+# Per-session context loading (one job per running session). Kept apart from
+# _background_pool so it never waits behind fire-and-forget work.
+_context_pool = ThreadPoolExecutor(
+    max_workers=ProcessingConfig.SESSION_WORKERS,
+    thread_name_prefix='session-ctx',
+)
+
+# Calendar list lookups that context jobs wait on. A separate pool rather than
+# _context_pool: context jobs blocking on futures in their own pool could
+# deadlock once it is full.
+_calendar_pool = ThreadPoolExecutor(
+    max_workers=ProcessingConfig.CALENDAR_LOOKUP_WORKERS,
+    thread_name_prefix='session-cal',
+)
+
+# Set once warm-up has been queued in this process
+_warm_up_started = False
+_warm_up_lock = threading.Lock()
+
+# (storage path, provider, model) → transcript. Checked before choosing the
+# URL or download path, so both share it.
+_transcript_cache = TTLCache(
+    maxsize=CacheConfig.TRANSCRIPT_MAX_ENTRIES,
+    ttl=CacheConfig.TRANSCRIPT_TTL_SECONDS,
+)
+
+
+def _submit_session(session_id: str, fn, *args, **kwargs) -> None:
+    """Queue a session on _session_pool, tracked so shutdown can cancel it."""
+    future = _session_pool.submit(fn, *args, **kwargs)
+    with _queued_sessions_lock:
+        _queued_sessions[future] = session_id
+    future.add_done_callback(_forget_session)
+
+
+def _forget_session(future) -> None:
+    with _queued_sessions_lock:
+        _queued_sessions.pop(future, None)
+
+
+def cancel_queued_sessions() -> None:
+    """Cancel sessions still waiting for a pool thread and mark them errored.
+
+    Called when the worker process is exiting; sessions already running are
+    left to finish.
+    """
+    with _queued_sessions_lock:
+        queued = list(_queued_sessions.items())
+    cancelled = [session_id for future, session_id in queued if future.cancel()]
+    _session_pool.shutdown(wait=False, cancel_futures=True)
+    for session_id in cancelled:
+        try:
+            DBSession.mark_error(session_id, "Server restarted before processing started")
+        except Exception as e:
+            logger.warning("Could not mark cancelled session %s as error: %s", session_id, e)
+    if cancelled:
+        logger.info("Cancelled %d queued sessions on shutdown", len(cancelled))
+
+
+def _wait_for_context(future) -> None:
+    """Wait for a context-loading job; a failure leaves the defaults in place."""
+    error = future.exception()
+    if error is not None:
+        logger.warning("Session context loading failed: %s", error)
+
 
 class SessionProcessor:
     """Processes sessions through the EXTRACT → RESOLVE → PERSONALIZE pipeline."""
@@ -45,45 +151,107 @@ class SessionProcessor:
         self.pattern_refresh_service = pattern_refresh_service
         self.icon_selector = get_icon_selector()
 
+        # file_type → preprocessor returning (text, metadata)
+        self._file_preprocessors = {
+            'audio': self._preprocess_audio,
+            'image': self._preprocess_image,
+            'pdf': self._preprocess_document,
+            'document': self._preprocess_document,
+            'text': self._preprocess_text_file,
+            'email': self._preprocess_text_file,
+        }
+
     # =========================================================================
     # Input preprocessing (unchanged)
     # =========================================================================
 
+    def _preprocess_audio(self, file_path: str, file_type: str) -> tuple:
+        return self._transcribe_audio(file_path), {'source': 'audio', 'file_path': file_path}
+
+    def _preprocess_image(self, file_path: str, file_type: str) -> tuple:
+        return self._prepare_image(file_path)
+
+    def _preprocess_document(self, file_path: str, file_type: str) -> tuple:
+        return self._convert_document(file_path), {'source': file_type, 'file_path': file_path}
+
+    @staticmethod
+    def _preprocess_text_file(file_path: str, file_type: str) -> tuple:
+        # Decode without keeping a name on the raw bytes, so they're
+        # freed here rather than held for the rest of the pipeline
+        text = FileStorage.download_file(file_path).decode('utf-8', errors='replace')
+        if not text or text.isspace():
+            raise ValueError("File is empty or contains no readable text")
+        return text, {'source': file_type, 'file_path': file_path}
+
     def _transcribe_audio(self, file_path: str) -> str:
-        """Download and transcribe an audio file from Supabase storage."""
-        import tempfile
-        from pipeline.input.storage import FileStorage
+        """Transcribe an audio file from Supabase storage."""
+        processor = self.input_processor_factory.get_processor(InputType.AUDIO)
+        cache_key = (file_path, getattr(processor, 'provider', None), getattr(processor, 'model', None))
+        cached = _transcript_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Audio transcript cache hit: %s → %d chars", file_path, len(cached))
+            return cached
+
+        result = None
+        if getattr(processor, 'supports_url', False):
+            result = self._transcribe_audio_url(processor, file_path)
+        if result is None:
+            result = self._transcribe_audio_file(file_path)
+
+        if not result.success:
+            raise ValueError(f"Audio transcription failed: {result.error}")
+        if not result.text or not result.text.strip():
+            raise ValueError("Audio transcription returned empty text")
+
+        logger.info("Audio transcribed: %s → %d chars", file_path, len(result.text))
+        _transcript_cache.set(cache_key, result.text)
+        return result.text
 
-        file_bytes = FileStorage.download_file(file_path)
+    @staticmethod
+    def _transcribe_audio_url(processor, file_path: str):
+        """Let the provider fetch the recording from a short-lived signed URL
+        (no download or temp file on our side). Returns None on failure —
+        e.g. the provider can't reach the storage URL — so the caller can
+        fall back to downloading the file."""
+        try:
+            url = FileStorage.get_file_url(
+                file_path, expires_in=ProcessingConfig.AUDIO_URL_EXPIRES_SECONDS,
+            )
+            result = processor.process_url(url, file_name=file_path)
+            error = None if result.success else result.error
+        except Exception as e:
+            result, error = None, e
+        if error is not None:
+            logger.warning(
+                "Audio URL transcription failed for %s, downloading instead: %s",
+                file_path, error,
+            )
+            return None
+        return result
 
+    def _transcribe_audio_file(self, file_path: str):
+        """Download to a temp file and transcribe it (providers that need the bytes)."""
+        # Stream straight to disk — recordings can be large, and the bytes are
+        # only needed by the transcriber, which reads the temp file
         ext = os.path.splitext(file_path)[1] or '.webm'
         with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            tmp.write(file_bytes)
             tmp_path = tmp.name
 
         try:
-            result = self.input_processor_factory.process_file(tmp_path, InputType.AUDIO)
-
-            if not result.success:
-                raise ValueError(f"Audio transcription failed: {result.error}")
-            if not result.text or not result.text.strip():
-                raise ValueError("Audio transcription returned empty text")
-
-            logger.info(f"Audio transcribed: {file_path} → {len(result.text)} chars")
-            return result.text
+            with open(tmp_path, 'wb') as out:
+                FileStorage.download_to_file(file_path, out)
+            return self.input_processor_factory.process_file(tmp_path, InputType.AUDIO)
         finally:
             os.unlink(tmp_path)
 
     def _prepare_image(self, file_path: str) -> tuple:
         """Download an image from Supabase, return (placeholder_text, metadata)."""
-        import base64
-        from pathlib import Path
-        from pipeline.input.storage import FileStorage
 
-        file_bytes = FileStorage.download_file(file_path)
-        image_data = base64.b64encode(file_bytes).decode('utf-8')
+        image_data = _b64encode(FileStorage.download_file(file_path))
 
-        ext = Path(file_path).suffix.lower()
+        path = Path(file_path)
+        file_name = path.name
+        ext = path.suffix.lower()
         media_types = {
             '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg',
             '.png': 'image/png', '.gif': 'image/gif',
@@ -91,66 +259,65 @@ class SessionProcessor:
         }
         media_type = media_types.get(ext, 'image/jpeg')
 
-        text = f"[Image: {Path(file_path).name}]"
+        text = f"[Image: {file_name}]"
         metadata = {
             'source': 'image',
             'file_path': file_path,
             'requires_vision': True,
             'image_data': image_data,
             'media_type': media_type,
-            'file_name': Path(file_path).name,
+            'file_name': file_name,
         }
 
-        logger.info(f"Image prepared: {file_path} → {len(image_data)} base64 chars")
+        logger.info("Image prepared: %s → %d base64 chars", file_path, len(image_data))
         return text, metadata
 
     def _convert_document(self, file_path: str) -> str:
         """Download a document from Supabase and convert to text.
 
-        For PDFs: tries PyPDF2 first (<1s), falls back to Docling (~30s)
-        only if PyPDF2 extracts very little text (scanned/image PDFs).
+        For PDFs: tries pdfplumber first (<1s), falls back to Docling (~30s)
+        only if pdfplumber extracts very little text (scanned/image PDFs).
         For other documents: uses Docling directly.
+
+        Both converters read from an in-memory stream, so the download never
+        touches disk.
         """
-        import tempfile
-        from pipeline.input.storage import FileStorage
 
         file_bytes = FileStorage.download_file(file_path)
-
         ext = os.path.splitext(file_path)[1] or '.docx'
-        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            tmp.write(file_bytes)
-            tmp_path = tmp.name
 
-        try:
-            # Fast path for PDFs: PyPDF2 text extraction
-            if ext.lower() == '.pdf':
-                text = self._fast_pdf_extract(tmp_path)
-                if text and len(text.strip()) > 100:
-                    logger.info(f"PDF extracted (fast): {file_path} → {len(text)} chars")
-                    return text
-                logger.info(f"Fast PDF extraction got {len(text.strip()) if text else 0} chars, falling back to Docling")
-
-            # Slow path: Docling (layout-aware, handles scanned PDFs)
-            from docling.document_converter import DocumentConverter
-            converter = DocumentConverter()
-            result = converter.convert(tmp_path)
-            text = result.document.export_to_markdown()
-
-            if not text or not text.strip():
-                raise ValueError("No text content could be extracted from the document")
-
-            logger.info(f"Document converted (Docling): {file_path} → {len(text)} chars")
-            return text
-        finally:
-            os.unlink(tmp_path)
+        # Fast path for PDFs: pdfplumber text extraction
+        if ext.lower() == '.pdf':
+            text = self._fast_pdf_extract(BytesIO(file_bytes))
+            if text and len(text.strip()) > 100:
+                logger.info("PDF extracted (fast): %s → %d chars", file_path, len(text))
+                return text
+            logger.info(
+                "Fast PDF extraction got %d chars, falling back to Docling",
+                len(text.strip()) if text else 0,
+            )
+
+        # Slow path: Docling (layout-aware, handles scanned PDFs), cached on
+        # disk by content hash so re-uploads skip conversion
+        text = convert_bytes_to_markdown(file_bytes, Path(file_path).stem + ext)
+
+        if not text or not text.strip():
+            raise ValueError("No text content could be extracted from the document")
+
+        logger.info("Document converted (Docling): %s → %d chars", file_path, len(text))
+        return text
 
     @staticmethod
-    def _fast_pdf_extract(pdf_path: str) -> str:
-        """Extract text from a PDF using pdfplumber. Fast (~1-2s) and handles tables."""
+    def _fast_pdf_extract(pdf_file) -> str:
+        """Extract text from a PDF using pdfplumber. Fast (~1-2s) and handles tables.
+
+        Args:
+            pdf_file: Path or binary file-like object
+        """
         try:
             import pdfplumber
             pages = []
-            with pdfplumber.open(pdf_path) as pdf:
+            with pdfplumber.open(pdf_file) as pdf:
                 for page in pdf.pages:
                     # Extract tables as markdown
                     tables = page.find_tables()
@@ -191,18 +358,21 @@ class SessionProcessor:
                             pages.append(text)
             return '\n\n'.join(pages)
         except Exception as e:
-            logger.debug(f"pdfplumber extraction failed: {e}")
+            logger.debug("pdfplumber extraction failed: %s", e)
             return ''
 
     def _get_user_timezone(self, user_id: str) -> str:
-        """Get user's timezone from profile, default to America/New_York."""
+        """Get user's timezone from profile, default to America/New_York.
+
+        Backed by PersonalizationService's per-user TTL cache, so back-to-back
+        sessions skip the users table round trip.
+        """
         try:
-            from database.models import User
-            user = User.get_by_id(user_id)
-            if user and user.get('timezone'):
-                return user['timezone']
+            timezone = PersonalizationService.get_timezone(user_id)
+            if timezone:
+                return timezone
         except Exception as e:
-            logger.warning(f"Could not fetch user timezone: {e}")
+            logger.warning("Could not fetch user timezone: %s", e)
         return 'America/New_York'
 
     def _select_and_update_icon(self, session_id: str, text: str) -> None:
@@ -214,9 +384,54 @@ class SessionProcessor:
             stream = get_stream(session_id)
             if stream:
                 stream.set_icon(icon)
-            logger.info(f"Icon selected for session {session_id}: '{icon}'")
+            logger.info("Icon selected for session %s: '%s'", session_id, icon)
+        except Exception as e:
+            logger.warning("Error selecting icon for session %s: %s", session_id, e)
+
+    @staticmethod
+    def _finish_without_events(session_id: str, input_type: str, is_guest: bool, pipeline_start: float) -> None:
+        """End a session that produced no events (SSE, trace, session row)."""
+        stream = get_stream(session_id)
+        if stream:
+            stream.mark_error("No events found in the provided input")
+        capture_pipeline_trace(
+            session_id, input_type, is_guest, 'no_events',
+            duration_ms=(_time.time() - pipeline_start) * 1000,
+        )
+        DBSession.mark_error(session_id, "No events found in the provided input")
+
+    @staticmethod
+    def _save_session_context(session_id: str, context_kwargs: dict) -> None:
+        """Persist input_summary / processed_text; a failure is logged, not raised."""
+        try:
+            DBSession.update_context(session_id, **context_kwargs)
         except Exception as e:
-            logger.warning(f"Error selecting icon for session {session_id}: {e}")
+            logger.warning("Failed to save context for session %s: %s", session_id, e)
+
+    @staticmethod
+    def _build_event_row(calendar_event) -> dict:
+        """Build the create_dropcal_events_batch row for a resolved CalendarEvent."""
+        # Dumped once: the same snapshot is stored as both the EXTRACT
+        # facts and the system suggestion (rows are serialized on insert).
+        dumped = calendar_event.model_dump()
+        start, end = calendar_event.start, calendar_event.end
+        start_date = start.date
+        return {
+            'summary': calendar_event.summary,
+            'start_time': start.dateTime,
+            'end_time': end.dateTime if end else None,
+            'start_date': start_date,
+            'end_date': end.date if end else None,
+            'is_all_day': start_date is not None,
+            'description': calendar_event.description,
+            'location': calendar_event.location,
+            'timezone': start.timeZone,
+            'calendar_name': calendar_event.calendar,
+            'original_input': '',
+            'extracted_facts': dumped,
+            'system_suggestion': dumped,
+            'recurrence': calendar_event.recurrence,
+        }
 
     @staticmethod
     def _calendar_event_to_frontend(cal_event, calendars_lookup=None, primary_calendar=None, event_id=None) -> dict:
@@ -229,12 +444,14 @@ class SessionProcessor:
             event_id: Optional DB event ID to include
         """
         tz = 'America/New_York'
-        if cal_event.start.date is not None:
-            start = {'date': cal_event.start.date, 'timeZone': tz}
-            end = {'date': cal_event.end.date if cal_event.end else cal_event.start.date, 'timeZone': tz}
+        ev_start, ev_end = cal_event.start, cal_event.end
+        start_date = ev_start.date
+        if start_date is not None:
+            start = {'date': start_date, 'timeZone': tz}
+            end = {'date': ev_end.date if ev_end else start_date, 'timeZone': tz}
         else:
-            start = {'dateTime': cal_event.start.dateTime, 'timeZone': tz}
-            end = {'dateTime': cal_event.end.dateTime if cal_event.end else None, 'timeZone': tz}
+            start = {'dateTime': ev_start.dateTime, 'timeZone': tz}
+            end = {'dateTime': ev_end.dateTime if ev_end else None, 'timeZone': tz}
 
         result = {
             'summary': cal_event.summary or '',
@@ -247,10 +464,11 @@ class SessionProcessor:
             result['location'] = cal_event.location
         if cal_event.description:
             result['description'] = cal_event.description
-        if cal_event.calendar:
-            result['calendar'] = cal_event.calendar
+        calendar = cal_event.calendar
+        if calendar:
+            result['calendar'] = calendar
             if calendars_lookup:
-                cal_info = calendars_lookup.get(cal_event.calendar)
+                cal_info = calendars_lookup.get(calendar)
                 if cal_info:
                     result['calendarName'] = cal_info['name']
                     result['calendarColor'] = cal_info['color']
@@ -275,16 +493,83 @@ class SessionProcessor:
             if self.pattern_refresh_service:
                 self.pattern_refresh_service.maybe_refresh(user_id)
 
-            from config.database import QueryLimits
-            historical_events = EventService.get_historical_events_with_embeddings(
-                user_id=user_id,
-                limit=QueryLimits.PERSONALIZATION_HISTORICAL_LIMIT
-            )
+            historical_events = self.personalization_service.get_historical_events(user_id)
             return patterns, historical_events
         except Exception as e:
-            logger.warning(f"Could not load personalization context: {e}")
+            logger.warning("Could not load personalization context: %s", e)
             return None, None
 
+    def _load_session_context(
+        self,
+        user_id: str,
+        is_guest: bool,
+        result: dict,
+        tracking: dict,
+        tz_ready: Optional[threading.Event] = None,
+    ) -> None:
+        """Load everything a session needs besides its input, into `result`.
+
+        Runs on _context_pool alongside EXTRACT (text sessions) or file
+        preprocessing (file sessions). Fills: timezone, patterns,
+        historical_events, calendars_lookup, primary_calendar.
+
+        Args:
+            tracking: Caller's get_tracking_snapshot(), so stage_span nests
+                under the session's trace.
+            tz_ready: Set as soon as the timezone is known — RESOLVE only
+                needs that, so it can start while the rest is still loading.
+        """
+        try:
+            apply_tracking_snapshot(tracking)
+            with stage_span("context_load"):
+                # Calendars don't depend on anything else here — fetch them
+                # alongside the timezone/personalization reads
+                calendars_future = (
+                    None if is_guest else _calendar_pool.submit(self._load_calendars, user_id)
+                )
+
+                result['timezone'] = self._get_user_timezone(user_id)
+                if tz_ready is not None:
+                    tz_ready.set()
+
+                p, h = self._load_personalization_context(user_id, is_guest)
+                result['patterns'] = p
+                result['historical_events'] = h
+                if p is not None:
+                    self.personalize_agent.build_similarity_index(h, user_id=user_id)
+
+                if calendars_future is not None:
+                    result['calendars_lookup'], result['primary_calendar'] = calendars_future.result()
+        finally:
+            # Whatever failed, never leave RESOLVE waiting on the timezone
+            if tz_ready is not None:
+                tz_ready.set()
+
+    @staticmethod
+    def _load_calendars(user_id: str) -> tuple:
+        """Return (calendars_lookup, primary_calendar) for SSE enrichment.
+
+        calendars_lookup maps provider_cal_id → {name, color}.
+        """
+        try:
+            cals = Calendar.get_by_user(user_id)
+            cal_lookup = {}
+            primary_cal = None
+            for cal in cals:
+                cal_id = cal.get('provider_cal_id')
+                if cal_id:
+                    info = {
+                        'name': cal.get('name', cal_id),
+                        'color': cal.get('color', '#1170C5'),
+                    }
+                    cal_lookup[cal_id] = info
+                    if cal.get('is_primary'):
+                        primary_cal = info
+            return cal_lookup, primary_cal
+        except Exception as e:
+            logger.warning("Could not load calendars for SSE enrichment: %s", e)
+            return {}, None
+
     # =========================================================================
     # Core pipeline
     # =========================================================================
@@ -297,6 +582,7 @@ class SessionProcessor:
         metadata: Optional[dict] = None,
         preloaded_context: Optional[dict] = None,
         session_start: Optional[float] = None,
+        session: Optional[dict] = None,
     ) -> None:
         """
         Run the full EXTRACT → RESOLVE → PERSONALIZE pipeline.
@@ -311,15 +597,22 @@ class SessionProcessor:
             session_start: Wall-clock start time from the caller (includes
                 preprocessing). Used for the Pipeline trace duration so it
                 reflects the full user-experienced latency.
+            session: Session row if the caller already fetched it, so the
+                pipeline doesn't re-read it from the database.
         """
-        session = DBSession.get_by_id(session_id)
+        if session is None:
+            session = DBSession.get_by_id_lite(session_id)
         is_guest = session.get('guest_mode', False) if session else False
         user_id = session.get('user_id', 'anonymous') if session else 'anonymous'
         pipeline_label = f"Session: {input_type}{' (guest)' if is_guest else ''}"
         pipeline_start = session_start or _time.time()
+        icon_future = None
 
         try:
-            DBSession.update_status(session_id, 'processing')
+            # Context loading: use preloaded (from file sessions) or start fresh
+            context_result = {}
+            tz_ready = threading.Event()
+            context_future = None
 
             set_tracking_context(
                 distinct_id=user_id,
@@ -328,75 +621,32 @@ class SessionProcessor:
                 pipeline=pipeline_label,
                 input_type=input_type,
                 is_guest=is_guest,
-                parent_id=CLEAR, num_events=CLEAR,
-                has_personalization=CLEAR, event_index=CLEAR,
-                event_description=CLEAR,
-                calendar_name=CLEAR,
             )
 
-            # ── Start parallel background work ──────────────────────────
-            icon_thread = threading.Thread(
-                target=self._select_and_update_icon,
-                args=(session_id, text),
-                daemon=True
-            )
-            icon_thread.start()
-
-            # Context loading: use preloaded (from file sessions) or start fresh
-            context_result = {}
-            tz_result = {}
-            context_thread = None
+            # Nothing to extract from: end before any context loading, icon
+            # job or LLM call is started
+            if not text or text.isspace():
+                logger.warning("Empty input for session %s", session_id)
+                self._finish_without_events(session_id, input_type, is_guest, pipeline_start)
+                return
 
             if preloaded_context is not None:
                 # File sessions pre-load context in parallel with input preprocessing
                 context_result = preloaded_context
-                tz_result['timezone'] = preloaded_context.get('timezone', 'America/New_York')
+                tz_ready.set()
             else:
-                # Text sessions: load context in parallel with EXTRACT
-                def _load_context_and_tz():
-                    # Set tracking context for this thread so stage_span works
-                    set_tracking_context(
-                        distinct_id=user_id,
-                        trace_id=session_id,
-                        session_id=session_id,
-                        pipeline=pipeline_label,
-                        input_type=input_type,
-                        is_guest=is_guest,
-                    )
-                    with stage_span("context_load"):
-                        p, h = self._load_personalization_context(user_id, is_guest)
-                        context_result['patterns'] = p
-                        context_result['historical_events'] = h
-                        if p is not None:
-                            self.personalize_agent.build_similarity_index(h)
-
-                        tz_result['timezone'] = self._get_user_timezone(user_id)
-
-                        if not is_guest:
-                            try:
-                                from database.models import Calendar
-                                cals = Calendar.get_by_user(user_id)
-                                cal_lookup = {}
-                                primary_cal = None
-                                for cal in cals:
-                                    cal_id = cal.get('provider_cal_id')
-                                    if cal_id:
-                                        info = {
-                                            'name': cal.get('name', cal_id),
-                                            'color': cal.get('color', '#1170C5'),
-                                        }
-                                        cal_lookup[cal_id] = info
-                                        if cal.get('is_primary'):
-                                            primary_cal = info
-                                context_result['calendars_lookup'] = cal_lookup
-                                context_result['primary_calendar'] = primary_cal
-                            except Exception as e:
-                                logger.warning(f"Could not load calendars for SSE enrichment: {e}")
-                                context_result['calendars_lookup'] = {}
-                                context_result['primary_calendar'] = None
-
-                context_thread = threading.Thread(target=_load_context_and_tz, daemon=True)
-                context_thread.start()
+                # Text sessions: load context in parallel with EXTRACT. Started
+                # before any other start-up I/O so it has the longest head start.
+                context_future = _context_pool.submit(
+                    self._load_session_context,
+                    user_id, is_guest, context_result,
+                    get_tracking_snapshot(), tz_ready,
+                )
+
+            # Callers that start the pipeline right away create the row as
+            # 'processing' already — skip the redundant write
+            if not session or session.get('status') != 'processing':
+                DBSession.update_status(session_id, 'processing')
 
             # ── EXTRACT: single LLM call ────────────────────────────────
             stream = get_stream(session_id)
@@ -408,7 +658,7 @@ class SessionProcessor:
                 text, input_type=input_type, metadata=metadata
             )
             extracted_events = extraction_result.events
-            logger.info(f"[timing] extract: {_time.time() - t_extract:.2f}s")
+            logger.info("[timing] extract: %.2fs", _time.time() - t_extract)
 
             # Update session title from extraction result
             session_title = extraction_result.session_title
@@ -416,7 +666,7 @@ class SessionProcessor:
             stream = get_stream(session_id)
             if stream:
                 stream.set_title(session_title)
-            logger.info(f"Title from extraction for session {session_id}: '{session_title}'")
+            logger.info("Title from extraction for session %s: '%s'", session_id, session_title)
 
             # Save context for the modification agent's context-fetch mechanism
             input_summary = getattr(extraction_result, 'input_summary', None)
@@ -428,10 +678,9 @@ class SessionProcessor:
             if input_type not in ('text', 'image'):
                 context_kwargs['processed_text'] = text
             if context_kwargs:
-                try:
-                    DBSession.update_context(session_id, **context_kwargs)
-                except Exception as e:
-                    logger.warning(f"Failed to save context for session {session_id}: {e}")
+                # Written before the session is marked processed, so an edit
+                # made right away already sees this context
+                self._save_session_context(session_id, context_kwargs)
 
             # Send event count to frontend as soon as extraction completes
             if extracted_events:
@@ -440,18 +689,14 @@ class SessionProcessor:
                     stream.set_event_count(len(extracted_events))
 
             if not extracted_events:
-                logger.warning(f"No events found in session {session_id}")
-                stream = get_stream(session_id)
-                if stream:
-                    stream.mark_error("No events found in the provided input")
-                capture_pipeline_trace(
-                    session_id, input_type, is_guest, 'no_events',
-                    duration_ms=(_time.time() - pipeline_start) * 1000,
-                )
-                flush_posthog()
-                DBSession.mark_error(session_id, "No events found in the provided input")
+                logger.warning("No events found in session %s", session_id)
+                self._finish_without_events(session_id, input_type, is_guest, pipeline_start)
                 return
 
+            # Icon selection (a local embedding lookup) runs alongside RESOLVE,
+            # and only for sessions that actually produced events
+            icon_future = _background_pool.submit(self._select_and_update_icon, session_id, text)
+
             set_tracking_context(num_events=len(extracted_events))
 
             # ── RESOLVE: parallel Duckling calls ────────────────────────
@@ -459,47 +704,90 @@ class SessionProcessor:
             if stream:
                 stream.set_stage('resolving')
 
-            # Wait for timezone (should be ready by now, extract takes ~6s)
-            if context_thread is not None:
-                context_thread.join()
-            timezone = tz_result.get('timezone', 'America/New_York')
+            # Wait for timezone only (should be ready by now, extract takes ~6s);
+            # the rest of the context keeps loading while RESOLVE runs.
+            # Bounded, so a stuck lookup falls back to the default timezone;
+            # a failed context job is logged before PERSONALIZE.
+            if not tz_ready.wait(timeout=ProcessingConfig.TIMEZONE_WAIT_SECONDS):
+                logger.warning(
+                    "Session %s: timezone not loaded after %ss, using default",
+                    session_id, ProcessingConfig.TIMEZONE_WAIT_SECONDS,
+                )
+            timezone = context_result.get('timezone', 'America/New_York')
 
             t_resolve = _time.time()
             with stage_span("resolution"):
                 calendar_events = []
 
+                # One reference time for the whole batch: relative dates resolve
+                # consistently, and repeated expressions share Duckling parses
+                try:
+                    reference_time = datetime.now(pytz.timezone(timezone))
+                except pytz.UnknownTimeZoneError:
+                    reference_time = None  # each resolve reports the bad zone
+
                 def _resolve_one(extracted):
-                    return resolve_temporal(extracted, user_timezone=timezone)
+                    return resolve_temporal(
+                        extracted, user_timezone=timezone, reference_time=reference_time,
+                    )
 
                 failed_events = []
-                with ThreadPoolExecutor(max_workers=min(len(extracted_events), 8)) as pool:
-                    future_to_idx = {
-                        pool.submit(_resolve_one, ext): i
-                        for i, ext in enumerate(extracted_events)
-                    }
-                    # Collect results preserving original order
-                    ordered_results = {}
-                    for future in future_to_idx:
-                        idx = future_to_idx[future]
+                max_workers = min(len(extracted_events), ProcessingConfig.MAX_WORKERS)
+                # One deadline for the whole batch, fixed before submission, so
+                # later futures get only the time that's actually left.
+                deadline = _time.monotonic() + ProcessingConfig.BATCH_TIMEOUT
+                pool = ThreadPoolExecutor(max_workers=max_workers)
+                try:
+                    # Identical extractions (forwarded threads, repeated
+                    # template rows) are resolved once and the result shared
+                    futures_by_key = {}
+                    futures = []
+                    for ext in extracted_events:
+                        key = ext.model_dump_json()
+                        future = futures_by_key.get(key)
+                        if future is None:
+                            future = futures_by_key[key] = pool.submit(_resolve_one, ext)
+                        futures.append(future)
+                    if len(futures_by_key) < len(futures):
+                        logger.info(
+                            "Resolving %d unique of %d extracted events",
+                            len(futures_by_key), len(futures),
+                        )
+                    # Collect results in submit order: event_ids from the batch
+                    # insert and the SSE push are matched to events by position.
+                    seen_futures = set()
+                    for extracted, future in zip(extracted_events, futures):
                         try:
-                            ordered_results[idx] = future.result()
+                            remaining = max(0.0, deadline - _time.monotonic())
+                            resolved = future.result(timeout=remaining)
+                            if id(future) in seen_futures:
+                                # Later stages mutate events in place
+                                resolved = resolved.model_copy(deep=True)
+                            seen_futures.add(id(future))
+                            calendar_events.append(resolved)
+                        except FutureTimeoutError:
+                            failed_events.append(extracted.summary)
+                            logger.warning(
+                                "Temporal resolution for '%s' exceeded the %ss batch deadline",
+                                extracted.summary, ProcessingConfig.BATCH_TIMEOUT,
+                            )
                         except Exception as e:
-                            failed_summary = extracted_events[idx].summary
+                            failed_summary = extracted.summary
                             failed_events.append(failed_summary)
                             logger.warning(
-                                f"Temporal resolution failed for '{failed_summary}': {e}"
+                                "Temporal resolution failed for '%s': %s", failed_summary, e
                             )
-
-                    for i in sorted(ordered_results):
-                        calendar_events.append(ordered_results[i])
+                finally:
+                    # Don't wait on stragglers past the deadline; queued work is dropped
+                    pool.shutdown(wait=False, cancel_futures=True)
 
                 if failed_events:
                     logger.warning(
-                        f"Dropped {len(failed_events)}/{len(extracted_events)} events "
-                        f"due to temporal resolution failures: {failed_events}"
+                        "Dropped %d/%d events due to temporal resolution failures: %s",
+                        len(failed_events), len(extracted_events), failed_events,
                     )
 
-            logger.info(f"[timing] resolve: {_time.time() - t_resolve:.2f}s")
+            logger.info("[timing] resolve: %.2fs", _time.time() - t_resolve)
 
             if not calendar_events:
                 DBSession.mark_error(session_id, "No events could be resolved")
@@ -511,10 +799,11 @@ class SessionProcessor:
                     duration_ms=(_time.time() - pipeline_start) * 1000,
                     error_message="All temporal resolutions failed",
                 )
-                flush_posthog()
                 return
 
             # ── PERSONALIZE: single batched call (or skip) ──────────────
+            if context_future is not None:
+                _wait_for_context(context_future)
             calendars_lookup = context_result.get('calendars_lookup', {})
             primary_calendar = context_result.get('primary_calendar')
             patterns = context_result.get('patterns')
@@ -526,18 +815,16 @@ class SessionProcessor:
                 stream = get_stream(session_id)
                 if stream:
                     stream.set_stage('personalizing')
-                logger.info(f"Session {session_id}: Personalizing {len(calendar_events)} events (batch)")
+                logger.info("Session %s: Personalizing %d events (batch)", session_id, len(calendar_events))
 
                 t_personalize = _time.time()
 
-                set_tracking_context(
-                    event_index=CLEAR,
-                    event_description=f"batch: {len(calendar_events)} events",
-                )
-
                 input_summary = getattr(extraction_result, 'input_summary', '') or ''
 
-                with stage_span("personalization"):
+                with tracking_override(
+                    event_index=CLEAR,
+                    event_description=f"batch: {len(calendar_events)} events",
+                ), stage_span("personalization"):
                     calendar_events, _, _, _ = self.personalize_agent.execute_batch(
                         events=calendar_events,
                         discovered_patterns=patterns,
@@ -546,29 +833,12 @@ class SessionProcessor:
                         input_summary=input_summary,
                     )
 
-                logger.info(f"[timing] personalize: {_time.time() - t_personalize:.2f}s")
+                logger.info("[timing] personalize: %.2fs", _time.time() - t_personalize)
 
             # ── SAVE: write events to DB (batch insert) ─────────────────
             # Save first so events have DB IDs before streaming to frontend.
             t_save = _time.time()
-            events_data = []
-            for calendar_event in calendar_events:
-                events_data.append({
-                    'summary': calendar_event.summary,
-                    'start_time': calendar_event.start.dateTime,
-                    'end_time': calendar_event.end.dateTime if calendar_event.end else None,
-                    'start_date': calendar_event.start.date,
-                    'end_date': calendar_event.end.date if calendar_event.end else None,
-                    'is_all_day': calendar_event.start.date is not None,
-                    'description': calendar_event.description,
-                    'location': calendar_event.location,
-                    'timezone': calendar_event.start.timeZone,
-                    'calendar_name': calendar_event.calendar,
-                    'original_input': '',
-                    'extracted_facts': calendar_event.model_dump(),
-                    'system_suggestion': calendar_event.model_dump(),
-                    'recurrence': calendar_event.recurrence,
-                })
+            events_data = [self._build_event_row(ce) for ce in calendar_events]
 
             with stage_span("save"):
                 created_events = EventService.create_dropcal_events_batch(
@@ -577,62 +847,67 @@ class SessionProcessor:
                     events_data=events_data,
                 )
 
-                # Deferred: save extracted event summaries alongside events
-                DBSession.update_extracted_events(session_id, [
-                    {'raw_text': [], 'description': e.summary}
-                    for e in extracted_events
-                ])
-
-            logger.info(f"[timing] save: {_time.time() - t_save:.2f}s")
-
             # Build event ID lookup from saved records
             event_ids = [e['id'] for e in created_events] if created_events else []
 
-            # Stream events to frontend with DB IDs already attached
+            # Stream events to frontend as soon as they have DB IDs
             stream = get_stream(session_id)
             if stream:
+                push_event = stream.push_event
+                to_frontend = self._calendar_event_to_frontend
+                num_ids = len(event_ids)
                 for i, cal_event in enumerate(calendar_events):
-                    event_id = event_ids[i] if i < len(event_ids) else None
-                    stream.push_event(self._calendar_event_to_frontend(
+                    event_id = event_ids[i] if i < num_ids else None
+                    push_event(to_frontend(
                         cal_event, calendars_lookup, primary_calendar, event_id=event_id
                     ))
 
-            DBSession.update_status(session_id, 'processed')
+            # Deferred: extracted event summaries are only read by later edits,
+            # so they're written after the events are already on screen —
+            # together with the final status, in a single UPDATE
+            DBSession.update_extracted_events(session_id, [
+                {'raw_text': [], 'description': e.summary}
+                for e in extracted_events
+            ], status='processed')
+
+            logger.info("[timing] save: %.2fs", _time.time() - t_save)
 
             # ── SIGNAL FRONTEND: pipeline complete ───────────────────────
             if stream:
                 stream.mark_done()
 
-            logger.info(f"[timing] total_pipeline: {_time.time() - pipeline_start:.2f}s")
+            # One clock read, so the log line and the trace agree
+            duration_ms = (_time.time() - pipeline_start) * 1000
+            logger.info("[timing] total_pipeline: %.2fs", duration_ms / 1000)
             capture_pipeline_trace(
                 session_id, input_type, is_guest, 'success',
                 num_events=len(calendar_events),
                 has_personalization=use_personalization,
-                duration_ms=(_time.time() - pipeline_start) * 1000,
+                duration_ms=duration_ms,
                 input_state={"text": text, "input_type": input_type},
-                output_state=[
-                    e.model_dump() for e in calendar_events
-                ],
+                output_state=[e['system_suggestion'] for e in events_data],
             )
-            flush_posthog()
 
             # ── BACKGROUND: compute embeddings (non-blocking) ───────────
             # Embeddings are only needed for future similarity search,
             # not for the current session. Compute after signaling done.
             if created_events:
-                embed_thread = threading.Thread(
-                    target=EventService.compute_embeddings_background,
-                    args=(created_events, events_data),
-                    daemon=True,
+                _background_pool.submit(
+                    EventService.compute_embeddings_background,
+                    created_events, events_data,
                 )
-                embed_thread.start()
 
         except Exception as e:
             error_message = str(e)
             logger.error(
-                f"Error processing session {session_id}: {error_message}\n"
-                f"{traceback.format_exc()}"
+                "Error processing session %s: %s", session_id, error_message,
+                exc_info=True,
             )
+            # Don't compute an icon for a failed session if the
+            # background pool hasn't picked it up yet. (RESOLVE work is
+            # already dropped by its pool shutdown.)
+            if icon_future is not None:
+                icon_future.cancel()
             # Signal SSE stream
             stream = get_stream(session_id)
             if stream:
@@ -645,25 +920,84 @@ class SessionProcessor:
             capture_agent_error("pipeline", e, {
                 'session_id': session_id, 'session_type': input_type
             })
-            flush_posthog()
             try:
                 DBSession.mark_error(session_id, error_message)
             except Exception as db_err:
                 logger.critical(
-                    f"Failed to mark session {session_id} as error "
-                    f"(original: {error_message}): {db_err}"
+                    "Failed to mark session %s as error (original: %s): %s",
+                    session_id, error_message, db_err,
                 )
 
+    # =========================================================================
+    # Warm-up
+    # =========================================================================
+
+    @staticmethod
+    def warm_up() -> None:
+        """Load the models the first sessions would otherwise load on demand.
+
+        Loads the sentence-transformer used for similarity search and the
+        Docling converter with its PDF pipeline (layout/OCR models). Failures
+        are logged and ignored — the pipeline loads them lazily anyway.
+        """
+        t0 = _time.time()
+        try:
+            from pipeline.personalization.similarity.service import get_embedding_model
+            get_embedding_model()
+        except Exception as e:
+            logger.warning("Warm-up: embedding model not loaded: %s", e)
+        try:
+            from docling.datamodel.base_models import InputFormat
+            from pipeline.input.document import get_document_converter
+            get_document_converter().initialize_pipeline(InputFormat.PDF)
+        except Exception as e:
+            logger.warning("Warm-up: Docling pipeline not initialized: %s", e)
+        logger.info("[timing] warm_up: %.2fs", _time.time() - t0)
+
+    def warm_up_in_background(self) -> None:
+        """Run warm_up on the shared background pool (once per process)."""
+        global _warm_up_started
+        with _warm_up_lock:
+            if _warm_up_started:
+                return
+            _warm_up_started = True
+        _background_pool.submit(self.warm_up)
+
     # =========================================================================
     # Public entry points
     # =========================================================================
 
-    def process_text_session(self, session_id: str, text: str) -> None:
-        """Process a text session through the pipeline."""
-        self._run_pipeline(session_id, text, input_type='text')
+    def start_text_session(
+        self, session_id: str, text: str, session: Optional[dict] = None
+    ) -> None:
+        """Queue a text session on the shared session pool and return immediately."""
+        _submit_session(session_id, self.process_text_session, session_id, text, session=session)
+
+    def start_file_session(
+        self, session_id: str, file_path: str, file_type: str,
+        session: Optional[dict] = None,
+    ) -> None:
+        """Queue a file session on the shared session pool and return immediately."""
+        _submit_session(
+            session_id,
+            self.process_file_session, session_id, file_path, file_type, session=session,
+        )
+
+    @isolated_tracking_context
+    def process_text_session(
+        self, session_id: str, text: str, session: Optional[dict] = None
+    ) -> None:
+        """Process a text session through the pipeline.
+
+        Pass the row returned by DBSession.create as `session` to skip
+        re-reading it.
+        """
+        self._run_pipeline(session_id, text, input_type='text', session=session)
 
+    @isolated_tracking_context
     def process_file_session(
-        self, session_id: str, file_path: str, file_type: str
+        self, session_id: str, file_path: str, file_type: str,
+        session: Optional[dict] = None,
     ) -> None:
         """Process a file session through the pipeline.
 
@@ -674,7 +1008,8 @@ class SessionProcessor:
         session_start = _time.time()
         try:
             # Determine user info for context preloading
-            session = DBSession.get_by_id(session_id)
+            if session is None:
+                session = DBSession.get_by_id_lite(session_id)
             is_guest = session.get('guest_mode', False) if session else False
             user_id = session.get('user_id', 'anonymous') if session else 'anonymous'
 
@@ -689,96 +1024,41 @@ class SessionProcessor:
 
             # Start context loading in parallel with file preprocessing
             context_result = {}
-            tz_result = {}
-
-            def _preload_context():
-                # Set tracking context for this thread so stage_span works
-                set_tracking_context(
-                    distinct_id=user_id,
-                    trace_id=session_id,
-                    session_id=session_id,
-                    input_type=file_type,
-                    is_guest=is_guest,
-                )
-                with stage_span("context_load"):
-                    p, h = self._load_personalization_context(user_id, is_guest)
-                    context_result['patterns'] = p
-                    context_result['historical_events'] = h
-                    if p is not None:
-                        self.personalize_agent.build_similarity_index(h)
-
-                    tz_result['timezone'] = self._get_user_timezone(user_id)
-
-                    if not is_guest:
-                        try:
-                            from database.models import Calendar
-                            cals = Calendar.get_by_user(user_id)
-                            cal_lookup = {}
-                            primary_cal = None
-                            for cal in cals:
-                                cal_id = cal.get('provider_cal_id')
-                                if cal_id:
-                                    info = {
-                                        'name': cal.get('name', cal_id),
-                                        'color': cal.get('color', '#1170C5'),
-                                    }
-                                    cal_lookup[cal_id] = info
-                                    if cal.get('is_primary'):
-                                        primary_cal = info
-                            context_result['calendars_lookup'] = cal_lookup
-                            context_result['primary_calendar'] = primary_cal
-                        except Exception as e:
-                            logger.warning(f"Could not load calendars for SSE enrichment: {e}")
-                            context_result['calendars_lookup'] = {}
-                            context_result['primary_calendar'] = None
-
-            preload_thread = threading.Thread(target=_preload_context, daemon=True)
-            preload_thread.start()
+            preload_future = _context_pool.submit(
+                self._load_session_context,
+                user_id, is_guest, context_result, get_tracking_snapshot(),
+            )
 
             # File preprocessing (runs in parallel with context loading)
             with stage_span("preprocessing"):
-                if file_type == 'audio':
-                    text = self._transcribe_audio(file_path)
-                    metadata = {'source': 'audio', 'file_path': file_path}
-                elif file_type == 'image':
-                    text, metadata = self._prepare_image(file_path)
-                elif file_type in ('pdf', 'document'):
-                    text = self._convert_document(file_path)
-                    metadata = {'source': file_type, 'file_path': file_path}
-                elif file_type in ('text', 'email'):
-                    from pipeline.input.storage import FileStorage
-                    file_bytes = FileStorage.download_file(file_path)
-                    text = file_bytes.decode('utf-8', errors='replace')
-                    if not text.strip():
-                        raise ValueError("File is empty or contains no readable text")
-                    metadata = {'source': file_type, 'file_path': file_path}
-                else:
+                preprocess = self._file_preprocessors.get(file_type)
+                if preprocess is None:
                     raise ValueError(f"Unsupported file type: {file_type}")
+                text, metadata = preprocess(file_path, file_type)
 
             # Wait for context loading to finish
-            preload_thread.join()
-            context_result['timezone'] = tz_result.get('timezone', 'America/New_York')
+            _wait_for_context(preload_future)
+            context_result.setdefault('timezone', 'America/New_York')
 
             # Pass preloaded context and real start time to _run_pipeline
             self._run_pipeline(
                 session_id, text, input_type=file_type,
                 metadata=metadata, preloaded_context=context_result,
-                session_start=session_start,
+                session_start=session_start, session=session,
             )
 
         except Exception as e:
             error_message = str(e)
-            logger.error(f"Error preprocessing file session {session_id}: {error_message}")
+            logger.error("Error preprocessing file session %s: %s", session_id, error_message)
             stream = get_stream(session_id)
             if stream:
                 stream.mark_error(error_message)
             capture_agent_error("pipeline", e, {
                 'session_id': session_id, 'session_type': 'file'
             })
-            flush_posthog()
             try:
                 DBSession.mark_error(session_id, error_message)
             except Exception as db_err:
                 logger.critical(
-                    f"Failed to mark session {session_id} as error: {db_err}"
+                    "Failed to mark session %s as error: %s", session_id, db_err
                 )
@@ -19,21 +19,25 @@ See backend/PIPELINE.md for architecture overview.
 import statistics
 import logging
 import time as _time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from langchain_anthropic import ChatAnthropic
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.messages import SystemMessage, HumanMessage
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime
 
 import numpy as np
 from pydantic import BaseModel, create_model, Field as PydanticField
 
 from pipeline.base_agent import BaseAgent
-from pipeline.prompt_loader import load_prompt
+from pipeline.prompt_loader import load_prompt, load_static_prompt
 from pipeline.models import CalendarEvent, CalendarDateTime
 from pipeline.personalization.similarity import ProductionSimilaritySearch
+from pipeline.cache import TTLCache
+from config.database import CacheConfig
 from config.posthog import capture_llm_generation
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
 
 class TimeInferenceOutput(BaseModel):
     """Compound output for time_inference task — can fill start, end, or both."""
@@ -97,20 +101,48 @@ class PersonalizationAgent(BaseAgent):
     - location: Resolve against user's history
     """
 
-    def __init__(self, llm: ChatAnthropic):
+    def __init__(self, llm: 'ChatAnthropic'):
         super().__init__("Personalize")
         self.llm = llm
-        self.similarity_search = None
+        # user_id → (historical_events, ProductionSimilaritySearch). The agent
+        # is shared by all sessions, so indexes must never cross users.
+        self._similarity_indexes = TTLCache(
+            maxsize=CacheConfig.HISTORICAL_EVENTS_MAX_ENTRIES,
+            ttl=CacheConfig.HISTORICAL_EVENTS_TTL_SECONDS,
+        )
 
     def execute(self, *args, **kwargs):
         """Delegate to execute_batch — personalization is batch-only."""
         return self.execute_batch(*args, **kwargs)
 
-    def build_similarity_index(self, historical_events: Optional[List[Dict]] = None):
-        """Pre-build the similarity search index (call before execute_batch)."""
-        if historical_events and len(historical_events) >= 3 and self.similarity_search is None:
-            self.similarity_search = ProductionSimilaritySearch()
-            self.similarity_search.build_index(historical_events)
+    def build_similarity_index(
+        self,
+        historical_events: Optional[List[Dict]] = None,
+        user_id: Optional[str] = None,
+    ):
+        """Pre-build the user's similarity search index (call before execute_batch)."""
+        if historical_events and len(historical_events) >= 3:
+            self._get_similarity_index(historical_events, user_id)
+
+    def _get_similarity_index(
+        self, historical_events: List[Dict], user_id: Optional[str]
+    ) -> ProductionSimilaritySearch:
+        """Return the index for this user's history, building it on first use.
+
+        Reused while the user's cached history list is unchanged (same
+        object), so back-to-back sessions skip re-encoding every title.
+        """
+        # Without a user_id, key on the list itself (the identity check
+        # below still guards against a recycled id)
+        key = user_id or id(historical_events)
+        cached = self._similarity_indexes.get(key)
+        if cached is not None and cached[0] is historical_events:
+            return cached[1]
+
+        index = ProductionSimilaritySearch()
+        index.build_index(historical_events)
+        self._similarity_indexes.set(key, (historical_events, index))
+        return index
 
     def execute_batch(
         self,
@@ -172,7 +204,7 @@ class PersonalizationAgent(BaseAgent):
         task_descriptions = []
         for task_name in all_tasks:
             task_def = TASK_DEFINITIONS[task_name]
-            task_descriptions.append(load_prompt(task_def['file']))
+            task_descriptions.append(load_static_prompt(task_def['file']))
 
         # --- Build per-event template contexts ---
         event_contexts = []
@@ -310,7 +342,9 @@ class PersonalizationAgent(BaseAgent):
         user_id: Optional[str],
     ) -> List[Dict]:
         """Pre-fetch per-event context data (similar events, surrounding, etc.) in parallel."""
-        contexts = [None] * len(events)
+        if not events:
+            # ThreadPoolExecutor(max_workers=0) raises — and there's nothing to fetch
+            return []
 
         # Scale down k per event as batch grows
         k_per_event = max(2, 7 - len(events) // 5)
@@ -318,14 +352,15 @@ class PersonalizationAgent(BaseAgent):
         # Batch-fetch corrections: 1 DB query + 1 batch encode instead of N of each
         per_event_corrections = self._batch_query_corrections(events, user_id)
 
-        def _fetch_context(i, event):
-            similar = self._find_similar_events(event, historical_events, k=k_per_event)
+        def _fetch_context(event, corrections):
+            similar = self._find_similar_events(
+                event, historical_events, k=k_per_event, user_id=user_id
+            )
             duration_stats = self._compute_duration_stats(similar)
             surrounding = self._fetch_surrounding_events(event, user_id)
             location_matches = self._fetch_location_history(event, user_id)
-            corrections = per_event_corrections[i]
             location_corrections = self._extract_location_corrections(corrections)
-            return i, {
+            return {
                 'similar_events': similar,
                 'duration_stats': duration_stats,
                 'surrounding_events': surrounding,
@@ -334,23 +369,24 @@ class PersonalizationAgent(BaseAgent):
                 'location_corrections': location_corrections,
             }
 
+        contexts = []
         with ThreadPoolExecutor(max_workers=min(len(events), 10)) as pool:
-            futures = {
-                pool.submit(_fetch_context, i, evt): i
-                for i, evt in enumerate(events)
-            }
-            for future in as_completed(futures):
+            futures = [
+                pool.submit(_fetch_context, evt, corrections)
+                for evt, corrections in zip(events, per_event_corrections)
+            ]
+            # Each worker returns its own dict; collect in submit order so no
+            # shared slot list or index bookkeeping is needed
+            for i, future in enumerate(futures):
                 try:
-                    idx, ctx = future.result()
-                    contexts[idx] = ctx
+                    contexts.append(future.result())
                 except Exception as e:
-                    i = futures[future]
                     logger.warning(f"Context prefetch failed for event {i}: {e}")
-                    contexts[i] = {
+                    contexts.append({
                         'similar_events': [], 'duration_stats': {},
                         'surrounding_events': [], 'location_matches': [],
                         'corrections': [], 'location_corrections': [],
-                    }
+                    })
 
         return contexts
 
@@ -599,6 +635,7 @@ class PersonalizationAgent(BaseAgent):
         event: CalendarEvent,
         historical_events: Optional[List[Dict]] = None,
         k: int = 7,
+        user_id: Optional[str] = None,
     ) -> List[Dict]:
         """
         Find similar historical events and include temporal data for duration inference.
@@ -607,16 +644,15 @@ class PersonalizationAgent(BaseAgent):
             event: CalendarEvent to find similar events for
             historical_events: User's historical events
             k: Number of similar events to return
+            user_id: Owner of historical_events (keys the reusable index)
 
         Returns list of dicts for display builders (not a formatted string).
         """
         if not historical_events or len(historical_events) < 3:
             return []
 
-        # Build similarity index if not already built (reused across events in session)
-        if self.similarity_search is None:
-            self.similarity_search = ProductionSimilaritySearch()
-            self.similarity_search.build_index(historical_events)
+        # Per-user index, built once and reused across events and sessions
+        similarity_search = self._get_similarity_index(historical_events, user_id)
 
         query_event = {
             'title': event.summary or '',
@@ -625,7 +661,7 @@ class PersonalizationAgent(BaseAgent):
         }
 
         try:
-            similar = self.similarity_search.find_similar_with_diversity(
+            similar = similarity_search.find_similar_with_diversity(
                 query_event,
                 k=k,
                 diversity_threshold=0.85
@@ -783,7 +819,7 @@ class PersonalizationAgent(BaseAgent):
         if not valid_corrections:
             return empty
 
-        stored_matrix = np.array(stored_embeddings)  # (num_corrections, dim)
+        stored_matrix = np.asarray(stored_embeddings, dtype=np.float32)  # (num_corrections, dim)
 
         # 3. Batch-embed all events using the global singleton model
         from pipeline.personalization.similarity.service import get_embedding_model
@@ -797,14 +833,19 @@ class PersonalizationAgent(BaseAgent):
         )  # (num_events, dim)
 
         # 4. Similarity matrix + per-event top-k ranking
-        similarity_matrix = event_embeddings @ stored_matrix.T  # (num_events, num_corrections)
+        similarity_matrix = event_embeddings.astype(np.float32, copy=False) @ stored_matrix.T  # (num_events, num_corrections)
 
-        per_event_results = []
-        for i in range(len(events)):
-            top_indices = np.argsort(similarity_matrix[i])[::-1][:k]
-            per_event_results.append([valid_corrections[idx] for idx in top_indices])
+        # Partial selection of the k best per row (one call for the whole
+        # matrix), then sort just those k — instead of fully sorting every row
+        k = min(k, similarity_matrix.shape[1])
+        top_indices = np.argpartition(-similarity_matrix, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarity_matrix, top_indices, axis=1)
+        top_indices = np.take_along_axis(top_indices, np.argsort(-top_scores, axis=1), axis=1)
 
-        return per_event_results
+        return [
+            [valid_corrections[idx] for idx in row]
+            for row in top_indices.tolist()
+        ]
 
     @staticmethod
     def _event_to_correction_text(event: CalendarEvent) -> str:
@@ -6,12 +6,14 @@ Handles embedding generation and database operations.
 """
 
 import json
+import logging
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Optional
 from database.supabase_client import get_supabase
 from .analyzer import CorrectionAnalyzer
 
+logger = logging.getLogger(__name__)
+
 
 class CorrectionStorageService:
     """
@@ -23,6 +25,7 @@ class CorrectionStorageService:
 
     def __init__(self):
         from config.similarity import EmbeddingConfig
+        from sentence_transformers import SentenceTransformer
         self.analyzer = CorrectionAnalyzer()
         # Reuse existing embedding model (same as similarity search)
         self.embedding_model = SentenceTransformer(EmbeddingConfig.MODEL_NAME)
@@ -93,7 +96,7 @@ class CorrectionStorageService:
             result = self.supabase.table('event_corrections').insert(correction_data).execute()
             return result.data[0]['id']
         except Exception as e:
-            print(f"Error storing correction: {e}")
+            logger.error(f"Error storing correction: {e}")
             # Don't fail - just log and continue
             return None
 
@@ -12,16 +12,18 @@ This service uses a hybrid approach:
 Note: Colors are not analyzed - they're a visual output determined by category assignment.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 from collections import defaultdict, Counter
 from datetime import datetime
 import json
-from langchain_anthropic import ChatAnthropic
 from pydantic import BaseModel
 from pipeline.prompt_loader import load_prompt
 from config.posthog import get_invoke_config, set_tracking_context
 from config.similarity import PatternDiscoveryConfig
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
 
 class PatternDiscoveryService:
     """
@@ -33,7 +35,7 @@ class PatternDiscoveryService:
     Colors are ignored - they're just visual output, not organizational dimensions
     """
 
-    def __init__(self, llm: ChatAnthropic):
+    def __init__(self, llm: 'ChatAnthropic'):
         """
         Initialize pattern discovery service.
 
@@ -14,8 +14,9 @@ from typing import Dict, List, Optional, Set, Tuple
 import calendars.factory as calendar_factory
 from database.models import Calendar
 from pipeline.personalization.pattern_discovery import PatternDiscoveryService
+from pipeline.personalization.service import PersonalizationService
 from config.calendar import RefreshConfig
-from config.posthog import set_tracking_context, flush_posthog
+from config.posthog import set_tracking_context, tracking_override, flush_posthog
 from config.similarity import PatternDiscoveryConfig
 
 logger = logging.getLogger(__name__)
@@ -234,6 +235,9 @@ class PatternRefreshService:
                     )
                     logger.info(f"Updated metadata for calendar: {cal.get('summary')}")
 
+            # Next session should see the refreshed calendars
+            PersonalizationService.invalidate_cache(user_id)
+
             logger.info(
                 f"Calendar refresh complete for user {user_id[:8]}: "
                 f"{len(new_cal_ids)} added, {len(stale_cal_ids)} refreshed, "
@@ -338,9 +342,6 @@ class PatternRefreshService:
             )
             return
 
-        # Set calendar name in tracking context for the LLM call
-        set_tracking_context(calendar_name=cal_name)
-
         # Load other calendar descriptions for cross-context
         all_calendars = Calendar.get_by_user(user_id)
         other_calendars = [
@@ -356,13 +357,15 @@ class PatternRefreshService:
             recency_bias=PatternDiscoveryConfig.RECENCY_BIAS_DEFAULT
         )
 
-        summary = self.pattern_discovery_service._analyze_category_with_llm(
-            category_name=cal_name,
-            is_primary=is_primary,
-            events=sampled,
-            total_count=current_count,
-            other_calendars=other_calendars
-        )
+        # Calendar name is attributed to this LLM call only
+        with tracking_override(calendar_name=cal_name):
+            summary = self.pattern_discovery_service._analyze_category_with_llm(
+                category_name=cal_name,
+                is_primary=is_primary,
+                events=sampled,
+                total_count=current_count,
+                other_calendars=other_calendars
+            )
 
         Calendar.upsert(
             user_id=user_id,
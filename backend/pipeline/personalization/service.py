@@ -9,16 +9,39 @@ from typing import Optional
 from datetime import datetime
 
 from database.models import User, Calendar
+from pipeline.cache import TTLCache
+from config.database import CacheConfig
 
 logger = logging.getLogger(__name__)
 
+# Marks a user known to have no patterns (load_patterns → None)
+_NO_PATTERNS = object()
+
 
 class PersonalizationService:
     """Service for managing user preferences and personalization via the database."""
 
-    def __init__(self):
-        # In-memory caches (per-process, cleared on deploy)
-        self._patterns_cache = {}
+    # In-memory caches (per-process, cleared on deploy). Shared by every
+    # instance so invalidation from the pattern refresh reaches the pipeline.
+    _patterns_cache = TTLCache(
+        maxsize=CacheConfig.USER_CACHE_MAX_ENTRIES,
+        ttl=CacheConfig.PATTERNS_TTL_SECONDS,
+    )
+    _timezone_cache = TTLCache(
+        maxsize=CacheConfig.USER_CACHE_MAX_ENTRIES,
+        ttl=CacheConfig.USER_TIMEZONE_TTL_SECONDS,
+    )
+    _history_cache = TTLCache(
+        maxsize=CacheConfig.HISTORICAL_EVENTS_MAX_ENTRIES,
+        ttl=CacheConfig.HISTORICAL_EVENTS_TTL_SECONDS,
+    )
+
+    @classmethod
+    def invalidate_cache(cls, user_id: str) -> None:
+        """Drop cached patterns, timezone and history so the next read hits the DB."""
+        cls._patterns_cache.pop(user_id)
+        cls._timezone_cache.pop(user_id)
+        cls._history_cache.pop(user_id)
 
     # =========================================================================
     # Patterns (style_stats + calendar data from DB)
@@ -34,8 +57,9 @@ class PersonalizationService:
         Returns:
             Dict with patterns if any exist, None otherwise.
         """
-        if user_id in self._patterns_cache:
-            return self._patterns_cache[user_id]
+        cached = self._patterns_cache.get(user_id)
+        if cached is not None:
+            return None if cached is _NO_PATTERNS else cached
 
         user = User.get_by_id(user_id)
         if not user:
@@ -62,6 +86,9 @@ class PersonalizationService:
                 }
 
         if not style_stats and not category_patterns:
+            self._patterns_cache.set(
+                user_id, _NO_PATTERNS, ttl=CacheConfig.NO_PATTERNS_TTL_SECONDS
+            )
             return None
 
         patterns = {
@@ -71,7 +98,7 @@ class PersonalizationService:
             'category_patterns': category_patterns,
         }
 
-        self._patterns_cache[user_id] = patterns
+        self._patterns_cache.set(user_id, patterns)
         return patterns
 
     def save_patterns(self, patterns: dict) -> bool:
@@ -92,8 +119,9 @@ class PersonalizationService:
 
             User.save_style_stats(user_id, style_stats, total_events_analyzed)
 
-            # Update cache
-            self._patterns_cache[user_id] = patterns
+            # Drop the cached copy: category_patterns are re-read from the
+            # calendars table, which the caller's dict may not reflect
+            self._patterns_cache.pop(user_id)
 
             return True
         except Exception as e:
@@ -102,8 +130,9 @@ class PersonalizationService:
 
     def has_patterns(self, user_id: str) -> bool:
         """Check if user has discovered patterns (style_stats or calendars)."""
-        if user_id in self._patterns_cache:
-            return True
+        cached = self._patterns_cache.get(user_id)
+        if cached is not None:
+            return cached is not _NO_PATTERNS
 
         user = User.get_by_id(user_id)
         if not user:
@@ -119,8 +148,7 @@ class PersonalizationService:
     def delete_patterns(self, user_id: str) -> bool:
         """Delete user's style_stats from DB and clear cache."""
         try:
-            if user_id in self._patterns_cache:
-                del self._patterns_cache[user_id]
+            self._patterns_cache.pop(user_id)
 
             user = User.get_by_id(user_id)
             if not user:
@@ -136,21 +164,55 @@ class PersonalizationService:
             logger.error(f"Error deleting patterns for {user_id}: {e}")
             return False
 
+    # =========================================================================
+    # Historical events (similarity search input)
+    # =========================================================================
+
+    @classmethod
+    def get_historical_events(cls, user_id: str) -> list:
+        """
+        Get the user's provider events with embeddings (cached per user).
+
+        The same list object is returned for the life of the cache entry, so
+        callers can key derived data (e.g. a similarity index) on it.
+        Treat it as read-only.
+        """
+        cached = cls._history_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        from pipeline.events import EventService
+        from config.database import QueryLimits
+        events = EventService.get_historical_events_with_embeddings(
+            user_id=user_id,
+            limit=QueryLimits.PERSONALIZATION_HISTORICAL_LIMIT
+        )
+        cls._history_cache.set(user_id, events)
+        return events
+
     # =========================================================================
     # Timezone (from users table directly)
     # =========================================================================
 
-    @staticmethod
-    def get_timezone(user_id: str) -> Optional[str]:
-        """Get user's timezone from their profile."""
+    @classmethod
+    def get_timezone(cls, user_id: str) -> Optional[str]:
+        """Get user's timezone from their profile (cached per user)."""
+        cached = cls._timezone_cache.get(user_id)
+        if cached is not None:
+            return cached or None
+
         user = User.get_by_id(user_id)
         if not user:
             return None
-        return user.get('timezone')
+        timezone = user.get('timezone')
+        # Cache "no timezone set" as '' so it isn't re-fetched every session
+        cls._timezone_cache.set(user_id, timezone or '')
+        return timezone
 
-    @staticmethod
-    def save_timezone(user_id: str, timezone: str) -> None:
+    @classmethod
+    def save_timezone(cls, user_id: str, timezone: str) -> None:
         """Save timezone to the users table."""
         from database.supabase_client import get_supabase
         supabase = get_supabase()
         supabase.table("users").update({"timezone": timezone}).eq("id", user_id).execute()
+        cls._timezone_cache.pop(user_id)
@@ -17,10 +17,11 @@ Architecture:
 """
 
 import re
+import logging
+import threading
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, TYPE_CHECKING
 from functools import lru_cache
-from sentence_transformers import SentenceTransformer, util
 
 from .models import (
     SimilarityBreakdown,
@@ -30,6 +31,11 @@ from .models import (
 )
 from config.similarity import EmbeddingConfig
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
 
 class CalendarEventSimilarity:
     """
@@ -164,6 +170,7 @@ class CalendarEventSimilarity:
         emb2 = self._get_embedding(text2)
 
         # Compute cosine similarity
+        from sentence_transformers import util
         similarity = util.cos_sim(emb1, emb2)[0][0]
 
         # Convert to float and ensure [0, 1] range
@@ -439,16 +446,14 @@ class TwoStageRetrieval:
         Example:
             >>> retrieval = TwoStageRetrieval()
             >>> retrieval.build_index(historical_events)
-            Building FAISS index for 1000 events...
-            ✓ Index built (384 dimensions)
         """
         if not historical_events:
-            print("Warning: No events provided, index will be empty")
+            logger.warning("No events provided, index will be empty")
             return
 
         self.events = historical_events
 
-        print(f"Building FAISS index for {len(historical_events)} events...")
+        logger.debug(f"Building FAISS index for {len(historical_events)} events")
 
         # Extract titles for embedding
         titles = [e.get('title', e.get('summary', '')) for e in historical_events]
@@ -483,7 +488,7 @@ class TwoStageRetrieval:
         faiss.normalize_L2(self.embeddings)
         self.index.add(self.embeddings)
 
-        print(f"✓ Index built ({dimension} dimensions, {self.index.ntotal} vectors)")
+        logger.debug(f"Index built ({dimension} dimensions, {self.index.ntotal} vectors)")
 
     def retrieve_similar(
         self,
@@ -925,17 +930,28 @@ class ProductionSimilaritySearch:
 # ============================================================================
 
 # Global model instance (lazy loaded)
-_global_model: Optional[SentenceTransformer] = None
+_global_model: Optional['SentenceTransformer'] = None
+_global_model_lock = threading.Lock()
 
 
-def get_embedding_model() -> SentenceTransformer:
-    """Get or create global embedding model (singleton)."""
+def get_embedding_model() -> 'SentenceTransformer':
+    """Get or create global embedding model (singleton).
+
+    The worker warm-up job and the first sessions can ask for it at the
+    same time; the lock makes sure only one of them builds it.
+    """
     global _global_model
     if _global_model is None:
-        print("Loading global sentence transformer model...")
-        _global_model = SentenceTransformer(EmbeddingConfig.MODEL_NAME)
-        _global_model.max_seq_length = EmbeddingConfig.MAX_SEQ_LENGTH
-        print("✓ Global model loaded")
+        with _global_model_lock:
+            if _global_model is None:
+                # Imported here: sentence_transformers pulls in torch, which only
+                # workers that actually embed should pay for
+                from sentence_transformers import SentenceTransformer
+                logger.info("Loading global sentence transformer model")
+                model = SentenceTransformer(EmbeddingConfig.MODEL_NAME)
+                model.max_seq_length = EmbeddingConfig.MAX_SEQ_LENGTH
+                _global_model = model
+                logger.info("Global sentence transformer model loaded")
     return _global_model
 
 
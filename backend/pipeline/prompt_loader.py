@@ -13,6 +13,7 @@ loading function that handles Jinja2 variable substitution.
     prompt = load_prompt("modification/prompts/modification.txt", current_date="2026-02-22")
 """
 
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from pathlib import Path
 
@@ -42,3 +43,20 @@ def load_prompt(path: str, **kwargs) -> str:
     """
     template = _env.get_template(path)
     return template.render(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def load_static_prompt(path: str) -> str:
+    """
+    Load a prompt that takes no template variables, rendering it once.
+
+    Static prompts are identical on every call, so the rendered string is
+    cached for the life of the process (prompt files ship with the code).
+
+    Args:
+        path: Path relative to backend/
+
+    Returns:
+        Rendered prompt string
+    """
+    return load_prompt(path)
@@ -17,6 +17,9 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from config.processing import ProcessingConfig
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +37,17 @@ class DucklingClient:
 
     Uses requests.Session for TCP connection keep-alive, reducing overhead
     when making many sequential or concurrent calls (e.g., resolving 10+
-    events in a session).
+    events in a session). The connection pool is sized to the RESOLVE fan-out
+    so concurrent resolutions don't open and drop extra connections.
     """
 
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = (base_url or DUCKLING_URL).rstrip("/")
         self._parse_url = f"{self.base_url}/parse"
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=ProcessingConfig.MAX_WORKERS)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def parse(
         self,
@@ -23,9 +23,22 @@ import pytz
 
 from pipeline.models import ExtractedEvent, CalendarEvent, CalendarDateTime
 from pipeline.resolution.duckling_client import DucklingClient, DucklingError
+from pipeline.cache import TTLCache
+from config.database import CacheConfig
 
 logger = logging.getLogger(__name__)
 
+# (text, timezone, reference time) → parsed datetime (or None). Events from one
+# input repeat the same expressions ("3pm", "Monday"); callers resolving a
+# batch pass one shared reference_time so each distinct string hits Duckling
+# once. Results are deterministic for a fixed key. Only used with an explicit
+# reference_time — a per-call datetime.now() would never hit.
+_parse_cache = TTLCache(
+    maxsize=CacheConfig.DUCKLING_PARSE_MAX_ENTRIES,
+    ttl=CacheConfig.DUCKLING_PARSE_TTL_SECONDS,
+)
+_MISS = object()
+
 # Singleton client — reused across calls
 _duckling_client: Optional[DucklingClient] = None
 
@@ -84,11 +97,12 @@ def resolve_temporal(
     now = reference_time or datetime.now(tz_obj)
     if now.tzinfo is None:
         now = tz_obj.localize(now)
+    memoize = reference_time is not None
 
     client = _get_client()
 
     # ── Resolve start date ────────────────────────────────────────────
-    start_resolved = _resolve_date(extracted.start_date, client, tz_obj, now)
+    start_resolved = _resolve_date(extracted.start_date, client, tz_obj, now, memoize)
     if start_resolved is None:
         raise ValueError(
             f"Could not resolve start_date: '{extracted.start_date}'"
@@ -97,7 +111,7 @@ def resolve_temporal(
     # ── Resolve end date (if provided) ────────────────────────────────
     end_date_resolved = None
     if extracted.end_date:
-        end_date_resolved = _resolve_date(extracted.end_date, client, tz_obj, now)
+        end_date_resolved = _resolve_date(extracted.end_date, client, tz_obj, now, memoize)
         if end_date_resolved is None:
             logger.warning(
                 f"Could not resolve end_date '{extracted.end_date}', ignoring"
@@ -107,7 +121,7 @@ def resolve_temporal(
     start_time_resolved = None
     if extracted.start_time:
         start_time_resolved = _resolve_time(
-            extracted.start_time, client, tz_obj, now
+            extracted.start_time, client, tz_obj, now, memoize
         )
         if start_time_resolved is None:
             logger.warning(
@@ -118,7 +132,7 @@ def resolve_temporal(
     end_time_resolved = None
     if extracted.end_time:
         end_time_resolved = _resolve_time(
-            extracted.end_time, client, tz_obj, now
+            extracted.end_time, client, tz_obj, now, memoize
         )
         if end_time_resolved is None:
             logger.warning(
@@ -164,6 +178,7 @@ def resolve_temporal(
         tz_obj,
         now,
         client,
+        memoize,
     )
 
     # If recurring with end_date, don't also set end on the event itself —
@@ -191,11 +206,12 @@ def _resolve_date(
     client: DucklingClient,
     tz_obj,
     now: datetime,
+    memoize: bool = False,
 ) -> Optional[datetime]:
     """Resolve a natural language date string to a datetime via Duckling."""
     if not text or not text.strip():
         return None
-    return _duckling_parse_datetime(text.strip(), client, tz_obj, now)
+    return _duckling_parse_datetime(text.strip(), client, tz_obj, now, memoize)
 
 
 def _resolve_time(
@@ -203,6 +219,7 @@ def _resolve_time(
     client: DucklingClient,
     tz_obj,
     now: datetime,
+    memoize: bool = False,
 ) -> Optional[datetime]:
     """Resolve a natural language time string to a datetime via Duckling.
 
@@ -211,7 +228,7 @@ def _resolve_time(
     """
     if not text or not text.strip():
         return None
-    return _duckling_parse_datetime(text.strip(), client, tz_obj, now)
+    return _duckling_parse_datetime(text.strip(), client, tz_obj, now, memoize)
 
 
 def _duckling_parse_datetime(
@@ -219,8 +236,18 @@ def _duckling_parse_datetime(
     client: DucklingClient,
     tz_obj,
     now: datetime,
+    memoize: bool = False,
 ) -> Optional[datetime]:
-    """Parse a datetime expression via Duckling."""
+    """Parse a datetime expression via Duckling.
+
+    With `memoize`, results are cached per (text, timezone, reference time).
+    """
+    key = (text, str(tz_obj), now.isoformat())
+    if memoize:
+        cached = _parse_cache.get(key, _MISS)
+        if cached is not _MISS:
+            return cached
+
     try:
         results = client.parse_time(
             text=text,
@@ -228,9 +255,18 @@ def _duckling_parse_datetime(
             timezone=str(tz_obj),
         )
     except DucklingError as e:
+        # Not cached: the service may be back on the next call
         logger.error(f"Duckling error parsing '{text}': {e}")
         return None
 
+    parsed = _pick_duckling_datetime(results, tz_obj)
+    if memoize:
+        _parse_cache.set(key, parsed)
+    return parsed
+
+
+def _pick_duckling_datetime(results: list, tz_obj) -> Optional[datetime]:
+    """Take the first non-latent Duckling result and convert it to a datetime."""
     if not results:
         return None
 
@@ -366,6 +402,7 @@ def _build_recurrence(
     tz_obj,
     now: datetime,
     client: DucklingClient,
+    memoize: bool = False,
 ) -> Optional[List[str]]:
     """Build the final recurrence list: RRULE (with UNTIL) + EXDATE entries.
 
@@ -387,7 +424,7 @@ def _build_recurrence(
     if excluded_dates:
         _append_exdates(
             recurrence, excluded_dates, is_all_day,
-            start_dt, user_timezone, tz_obj, now, client,
+            start_dt, user_timezone, tz_obj, now, client, memoize,
         )
 
     return recurrence if recurrence else None
@@ -435,6 +472,7 @@ def _append_exdates(
     tz_obj,
     now: datetime,
     client: DucklingClient,
+    memoize: bool = False,
 ) -> None:
     """Convert natural language excluded_dates into iCalendar EXDATE entries
     and append them to the recurrence list.
@@ -446,7 +484,7 @@ def _append_exdates(
         if not date_str or not date_str.strip():
             continue
 
-        exc_dt = _duckling_parse_datetime(date_str.strip(), client, tz_obj, now)
+        exc_dt = _duckling_parse_datetime(date_str.strip(), client, tz_obj, now, memoize)
         if exc_dt is None:
             logger.warning(f"Could not resolve excluded date: '{date_str}'")
             continue
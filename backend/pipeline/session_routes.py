@@ -9,9 +9,20 @@ from flask import Blueprint, Response, jsonify
 from database.models import Session as DBSession
 from pipeline.stream import get_stream, cleanup_stream
 from pipeline.events import EventService
-import json
 import time
 
+try:
+    # C encoder; the growing event list is re-serialized on every push
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 sessions_bp = Blueprint('sessions', __name__, url_prefix='/sessions')
 
 
@@ -39,20 +50,20 @@ def stream_session_updates(session_id: str):
     def generate():
         session = DBSession.get_by_id_lite(session_id)
         if not session:
-            yield f"event: error\ndata: {json.dumps({'error': 'Session not found'})}\n\n"
+            yield f"event: error\ndata: {_dumps({'error': 'Session not found'})}\n\n"
             return
 
         # Send initial state
-        yield f"event: init\ndata: {json.dumps({'id': session_id, 'status': session.get('status'), 'title': session.get('title'), 'icon': session.get('icon')})}\n\n"
+        yield f"event: init\ndata: {_dumps({'id': session_id, 'status': session.get('status'), 'title': session.get('title'), 'icon': session.get('icon')})}\n\n"
 
         # If already processed, send events from DB and close
         if session.get('status') == 'processed':
             events = EventService.get_events_by_session(session_id)
-            yield f"event: event\ndata: {json.dumps({'events': events})}\n\n"
-            yield f"event: complete\ndata: {json.dumps({'status': 'processed'})}\n\n"
+            yield f"event: event\ndata: {_dumps({'events': events})}\n\n"
+            yield f"event: complete\ndata: {_dumps({'status': 'processed'})}\n\n"
             return
         if session.get('status') == 'error':
-            yield f"event: error\ndata: {json.dumps({'error': session.get('error_message', 'Processing failed')})}\n\n"
+            yield f"event: error\ndata: {_dumps({'error': session.get('error_message', 'Processing failed')})}\n\n"
             return
 
         # Stream from in-memory pipeline
@@ -79,38 +90,38 @@ def stream_session_updates(session_id: str):
 
             # Stage update
             if stream.stage and stream.stage != last_stage:
-                yield f"event: stage\ndata: {json.dumps({'stage': stream.stage})}\n\n"
+                yield f"event: stage\ndata: {_dumps({'stage': stream.stage})}\n\n"
                 last_stage = stream.stage
                 sent_data = True
 
             # Title update
             if stream.title and stream.title != last_title:
-                yield f"event: title\ndata: {json.dumps({'title': stream.title})}\n\n"
+                yield f"event: title\ndata: {_dumps({'title': stream.title})}\n\n"
                 last_title = stream.title
                 sent_data = True
 
             # Icon update
             if stream.icon and stream.icon != last_icon:
-                yield f"event: icon\ndata: {json.dumps({'icon': stream.icon})}\n\n"
+                yield f"event: icon\ndata: {_dumps({'icon': stream.icon})}\n\n"
                 last_icon = stream.icon
                 sent_data = True
 
             # Event count (known after extraction, before resolution)
             if stream.event_count is not None and stream.event_count != last_event_count:
-                yield f"event: count\ndata: {json.dumps({'count': stream.event_count})}\n\n"
+                yield f"event: count\ndata: {_dumps({'count': stream.event_count})}\n\n"
                 last_event_count = stream.event_count
                 sent_data = True
 
             # Events changed (uses revision to detect both additions and replacements)
             current_revision = stream._revision
             if current_revision > last_revision and len(stream.events) > 0:
-                yield f"event: event\ndata: {json.dumps({'events': list(stream.events)})}\n\n"
+                yield f"event: event\ndata: {_dumps({'events': list(stream.events)})}\n\n"
                 last_revision = current_revision
                 sent_data = True
 
             # Error
             if stream.error:
-                yield f"event: error\ndata: {json.dumps({'error': stream.error})}\n\n"
+                yield f"event: error\ndata: {_dumps({'error': stream.error})}\n\n"
                 cleanup_stream(session_id)
                 return
 
@@ -119,8 +130,8 @@ def stream_session_updates(session_id: str):
                 # Always send final events — personalization may have replaced
                 # them without changing the count
                 if stream.events:
-                    yield f"event: event\ndata: {json.dumps({'events': list(stream.events)})}\n\n"
-                yield f"event: complete\ndata: {json.dumps({'status': 'processed'})}\n\n"
+                    yield f"event: event\ndata: {_dumps({'events': list(stream.events)})}\n\n"
+                yield f"event: complete\ndata: {_dumps({'status': 'processed'})}\n\n"
                 cleanup_stream(session_id)
                 return
 
@@ -131,7 +142,7 @@ def stream_session_updates(session_id: str):
                 last_heartbeat = now
 
         # Timeout
-        yield f"event: timeout\ndata: {json.dumps({'message': 'Stream timeout'})}\n\n"
+        yield f"event: timeout\ndata: {_dumps({'message': 'Stream timeout'})}\n\n"
         cleanup_stream(session_id)
 
     return Response(
@@ -166,29 +177,29 @@ def _poll_db_fallback(session_id, session):
         current_status = session.get('status')
 
         if current_title and current_title != last_title:
-            yield f"event: title\ndata: {json.dumps({'title': current_title})}\n\n"
+            yield f"event: title\ndata: {_dumps({'title': current_title})}\n\n"
             last_title = current_title
             sent_data = True
 
         current_icon = session.get('icon')
         if current_icon and current_icon != last_icon:
-            yield f"event: icon\ndata: {json.dumps({'icon': current_icon})}\n\n"
+            yield f"event: icon\ndata: {_dumps({'icon': current_icon})}\n\n"
             last_icon = current_icon
             sent_data = True
 
         if current_status != last_status:
-            yield f"event: status\ndata: {json.dumps({'status': current_status})}\n\n"
+            yield f"event: status\ndata: {_dumps({'status': current_status})}\n\n"
             last_status = current_status
             sent_data = True
 
             if current_status in ['processed', 'error']:
                 if current_status == 'processed':
                     events = EventService.get_events_by_session(session_id)
-                    yield f"event: event\ndata: {json.dumps({'events': events})}\n\n"
-                    yield f"event: complete\ndata: {json.dumps({'status': 'processed'})}\n\n"
+                    yield f"event: event\ndata: {_dumps({'events': events})}\n\n"
+                    yield f"event: complete\ndata: {_dumps({'status': 'processed'})}\n\n"
                 else:
                     error_msg = session.get('error_message', 'Processing failed')
-                    yield f"event: error\ndata: {json.dumps({'error': error_msg})}\n\n"
+                    yield f"event: error\ndata: {_dumps({'error': error_msg})}\n\n"
                 return
 
         # Heartbeat to keep connection alive through ALB/Nginx
@@ -197,7 +208,7 @@ def _poll_db_fallback(session_id, session):
             yield ":heartbeat\n\n"
             last_heartbeat = now
 
-    yield f"event: timeout\ndata: {json.dumps({'message': 'Stream timeout'})}\n\n"
+    yield f"event: timeout\ndata: {_dumps({'message': 'Stream timeout'})}\n\n"
 
 
 @sessions_bp.route('/<session_id>', methods=['DELETE'])
@@ -0,0 +1,103 @@
+"""
+Tests for the in-process TTL cache used on the session hot path.
+"""
+
+import os
+import sys
+
+backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
+
+from pipeline import cache as cache_module
+from pipeline.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _with_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', clock)
+    return clock
+
+
+class TestTTLCache:
+    """Expiry and eviction behaviour."""
+
+    def test_get_returns_value_until_expiry(self, monkeypatch):
+        clock = _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('user-1', 'America/Chicago')
+
+        clock.now += 59
+        assert cache.get('user-1') == 'America/Chicago'
+
+        clock.now += 2
+        assert cache.get('user-1') is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_override(self, monkeypatch):
+        clock = _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('short', 1, ttl=5)
+        cache.set('long', 2)
+
+        clock.now += 10
+        assert cache.get('short') is None
+        assert cache.get('long') == 2
+
+    def test_evicts_least_recently_used_when_full(self, monkeypatch):
+        _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_expired_entries_are_purged_before_lru_eviction(self, monkeypatch):
+        clock = _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('stale', 1, ttl=1)
+        cache.set('fresh', 2)
+
+        clock.now += 5
+        cache.set('new', 3)
+
+        assert cache.get('fresh') == 2
+        assert cache.get('new') == 3
+
+    def test_expired_entries_are_purged_on_every_insert(self, monkeypatch):
+        clock = _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        clock.now += 61
+        cache.set('c', 3)
+
+        assert len(cache) == 1
+        assert cache.get('c') == 3
+
+    def test_pop_and_clear(self, monkeypatch):
+        _with_clock(monkeypatch)
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        cache.pop('a')
+        cache.pop('missing')
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+
+        cache.clear()
+        assert len(cache) == 0
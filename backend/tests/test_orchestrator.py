@@ -0,0 +1,109 @@
+"""
+Tests for SessionProcessor's hand-off between context loading and RESOLVE.
+"""
+
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
+
+orchestrator = pytest.importorskip('pipeline.orchestrator', exc_type=ImportError)
+SessionProcessor = orchestrator.SessionProcessor
+
+
+class FakeEvent:
+    """Stands in for an ExtractedEvent / CalendarEvent."""
+
+    def __init__(self, summary):
+        self.summary = summary
+
+    def model_dump_json(self):
+        return self.summary
+
+    def model_copy(self, deep=False):
+        return FakeEvent(self.summary)
+
+
+class FakeSessions:
+    """Records the session writes the pipeline makes."""
+
+    def __init__(self):
+        self.status = None
+        self.error = None
+
+    def update_status(self, session_id, status):
+        self.status = status
+
+    def update_title(self, session_id, title):
+        pass
+
+    def update_extracted_events(self, session_id, events, status=None):
+        self.status = status
+
+    def mark_error(self, session_id, message):
+        self.status = 'error'
+        self.error = message
+
+
+def _processor(events):
+    processor = SessionProcessor.__new__(SessionProcessor)
+    batch = SimpleNamespace(session_title='Title', input_summary='', events=events)
+    processor.extractor = SimpleNamespace(execute=lambda *a, **kw: (batch, None, None))
+    processor._select_and_update_icon = lambda session_id, text: None
+    return processor
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    fake = FakeSessions()
+    monkeypatch.setattr(orchestrator, 'DBSession', fake)
+    monkeypatch.setattr(orchestrator, 'get_stream', lambda session_id: None)
+    monkeypatch.setattr(orchestrator, 'capture_pipeline_trace', lambda *a, **kw: None)
+    monkeypatch.setattr(
+        orchestrator, 'resolve_temporal', lambda extracted, **kw: extracted,
+    )
+    monkeypatch.setattr(
+        orchestrator.EventService, 'create_dropcal_events_batch',
+        staticmethod(lambda user_id, session_id, events_data: [
+            {'id': f'evt-{i}'} for i, _ in enumerate(events_data)
+        ]),
+    )
+    monkeypatch.setattr(
+        SessionProcessor, '_build_event_row',
+        staticmethod(lambda ce: {'summary': ce.summary, 'system_suggestion': {}}),
+    )
+    monkeypatch.setattr(orchestrator.ProcessingConfig, 'TIMEZONE_WAIT_SECONDS', 5)
+    return fake
+
+
+class TestContextHandOff:
+    """RESOLVE must never wait forever on the timezone."""
+
+    def test_pipeline_finishes_when_context_load_fails_before_timezone(
+        self, sessions, monkeypatch
+    ):
+        def failing_snapshot(tracking):
+            raise RuntimeError("tracking unavailable")
+
+        monkeypatch.setattr(orchestrator, 'apply_tracking_snapshot', failing_snapshot)
+        processor = _processor([FakeEvent('Dentist')])
+        session = {'user_id': 'user-1', 'guest_mode': False, 'status': 'processing'}
+
+        runner = threading.Thread(
+            target=processor._run_pipeline,
+            args=('session-1', 'Dentist tomorrow at 3pm'),
+            kwargs={'input_type': 'text', 'session': session},
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=3)
+
+        assert not runner.is_alive(), "pipeline blocked waiting for the timezone"
+        assert sessions.status == 'processed'
+        assert sessions.error is None